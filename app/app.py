@@ -1,41 +1,128 @@
-from flask import Flask, render_template, request, redirect, jsonify, flash
+from flask import Flask, render_template, request, redirect, jsonify, flash, make_response, session, send_file
 import os
+import asyncio
 import subprocess
 import logging
+import logging.handlers
+import queue
+import atexit
+import copy
 import time
 import re
 import json
+import socket
+import ipaddress
 from datetime import datetime
 import threading
+import functools
+import shutil
+import signal
+import hashlib
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import psutil
+from jinja2 import FileSystemBytecodeCache
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to Flask's stdlib-json jsonify
+    orjson = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # optional; /status falls back to tailing the logs per poll
+    INotify = None
+
+try:
+    from pydbus import SystemBus
+except ImportError:  # optional; fall back to batched `systemctl is-active` and nmcli
+    SystemBus = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # optional; responses go out uncompressed
+    Compress = None
 
 app = Flask(__name__)
 app.secret_key = 'wifi-test-dashboard-secret-key'
 
+# Templates only change on reinstall: skip the per-render mtime check and keep
+# compiled template bytecode across restarts (per-user temp dir)
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+# gzip the dashboard HTML and JSON polls; streamed responses (the SSE
+# throughput feed) are left alone so events are not held in the compressor
+if Compress is not None:
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+
 # Configuration
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(BASE_DIR, "configs", "ssid.conf")
 SETTINGS_FILE = os.path.join(BASE_DIR, "configs", "settings.conf")
 LOG_DIR = os.path.join(BASE_DIR, "logs")
 
-IFACES = ["eth0", "wlan0", "wlan1"]
+# External commands resolved once at import, so each exec skips the PATH walk
+SUDO = shutil.which("sudo") or "/usr/bin/sudo"
+SYSTEMCTL = shutil.which("systemctl") or "/usr/bin/systemctl"
+TC = shutil.which("tc") or "/usr/sbin/tc"
+NMCLI = shutil.which("nmcli") or "/usr/bin/nmcli"
+
+IFACES = ("eth0", "wlan0", "wlan1")
 STATS_DIR = "/home/pi/wifi_test_dashboard/stats"
 BASELINE_FILE = os.path.join(STATS_DIR, "io_baselines.json")
 _MB = 1024 * 1024
 
+# Shared pool for overlapping independent subprocess calls and log reads
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="io")
+
 _state_lock = threading.Lock()
 _state = {
     "prev": {},          # {iface: {"rx": int, "tx": int}}
     "totals": {},        # {iface: {"download": int_bytes, "upload": int_bytes}}
     "last_ts": None,
 }
+# monotonic_ns of the previous sample taken by this process; rates are timed
+# with it, while the wall-clock last_ts above is only kept for the baseline file
+_last_sample_ns = None
+
+_IFACES_BY_BYTES = {i.encode(): i for i in IFACES}
+
+_proc_net_dev = None
+_proc_net_dev_lock = threading.Lock()
+
+def read_proc_net_dev():
+    """Raw /proc/net/dev, re-read through one descriptor kept open across samples"""
+    global _proc_net_dev
+    with _proc_net_dev_lock:
+        for attempt in (0, 1):
+            try:
+                if _proc_net_dev is None:
+                    _proc_net_dev = open("/proc/net/dev", "rb", buffering=0)
+                _proc_net_dev.seek(0)
+                return _proc_net_dev.readall()
+            except OSError:
+                if _proc_net_dev is not None:
+                    _proc_net_dev.close()
+                _proc_net_dev = None
+                if attempt:
+                    raise
 
 def _read_now():
-    per = psutil.net_io_counters(pernic=True)
+    """rx/tx byte and packet counters for IFACES, parsed straight from /proc/net/dev"""
+    data = read_proc_net_dev()
     now = {}
-    for i in IFACES:
-        if i in per:
-            now[i] = {"rx": per[i].bytes_recv, "tx": per[i].bytes_sent}
+    for line in data.splitlines()[2:]:  # skip the two header lines
+        name, _, rest = line.partition(b":")
+        i = _IFACES_BY_BYTES.get(name.strip())
+        if i is None:
+            continue
+        fields = rest.split()
+        now[i] = {"rx": int(fields[0]), "tx": int(fields[8]),
+                  "rx_packets": int(fields[1]), "tx_packets": int(fields[9])}
     return now
 
 def _load_baseline():
@@ -50,51 +137,120 @@ def _load_baseline():
     except Exception:
         return {"prev": {}, "totals": {}, "last_ts": time.time()}
 
-def _save_baseline():
-    os.makedirs(STATS_DIR, exist_ok=True)
-    tmp = BASELINE_FILE + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(_state, f)
-    os.replace(tmp, BASELINE_FILE)
+BASELINE_SAVE_INTERVAL = 5.0   # seconds between baseline writes
+_last_save_ts = 0.0
+_baseline_write_lock = threading.Lock()      # one writer at a time, in snapshot order
+_baseline_pending = None                     # newest snapshot not yet written
+_baseline_pending_lock = threading.Lock()
+_baseline_exit_hook = False
+
+def _save_baseline(force=False):
+    """Snapshot _state for persistence (caller holds _state_lock).
+
+    Writes are debounced to one per BASELINE_SAVE_INTERVAL and happen on the
+    I/O pool, so the disk write never runs while _state_lock is held. Each
+    snapshot replaces any still-pending one, so an older write can never land
+    after a newer one.
+    """
+    global _last_save_ts, _baseline_pending
+    now = time.monotonic()
+    if not force and now - _last_save_ts < BASELINE_SAVE_INTERVAL:
+        return
+    _last_save_ts = now
+    with _baseline_pending_lock:
+        queued = _baseline_pending is not None   # a flush is already on its way
+        _baseline_pending = json.dumps(_state)
+    if not queued:
+        _io_pool.submit(_flush_baseline)
+
+def _flush_baseline():
+    """Write the newest pending snapshot, if any"""
+    global _baseline_pending
+    with _baseline_write_lock:
+        # taken under the write lock, so whatever is written next is newer
+        with _baseline_pending_lock:
+            payload, _baseline_pending = _baseline_pending, None
+        if payload is not None:
+            _write_baseline(payload)
+
+def _save_baseline_at_exit():
+    """Persist totals accumulated since the last debounced write"""
+    global _baseline_pending
+    # Written inline: the I/O pool no longer takes work once shutdown starts
+    with _state_lock:
+        with _baseline_pending_lock:
+            _baseline_pending = json.dumps(_state)
+    _flush_baseline()
+
+def _write_baseline(payload):
+    try:
+        os.makedirs(STATS_DIR, exist_ok=True)
+        tmp = BASELINE_FILE + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(payload)
+        os.replace(tmp, BASELINE_FILE)
+    except Exception as e:
+        logger.error("Error saving throughput baseline: %s", e)
 
 def get_kernel_throughput():
-    """Return dict: iface -> {download, upload, total_download, total_upload}"""
+    """Return dict: iface -> {download, upload (Mbps, 2 dp), total_download, total_upload (MB, 1 dp), packets}"""
+    global _last_sample_ns, _baseline_exit_hook
     with _state_lock:
         # first run: initialize from disk (if present)
         if _state["last_ts"] is None or not _state["prev"]:
             data = _load_baseline()
             _state.update(data)
+            if not _baseline_exit_hook:
+                # Registered here rather than at import so it runs before the
+                # log listener's atexit stop and its errors still get logged
+                atexit.register(_save_baseline_at_exit)
+                _baseline_exit_hook = True
+            # seed totals once so the per-sample loop needs no setdefault
+            for i in IFACES:
+                _state["totals"].setdefault(i, {"download": 0, "upload": 0})
             if not _state["prev"]:
                 _state["prev"] = _read_now()
                 _state["last_ts"] = time.time()
-                for i in IFACES:
-                    _state["totals"].setdefault(i, {"download": 0, "upload": 0})
-                _save_baseline()
+                _last_sample_ns = time.monotonic_ns()
+                _save_baseline(force=True)
                 # first response has no deltas yet
                 out = {}
                 for i in IFACES:
                     t = _state["totals"].get(i, {"download": 0, "upload": 0})
+                    c = _state["prev"].get(i, {})
                     out[i] = {
                         "download": 0.0,
                         "upload": 0.0,
-                        "total_download": t["download"] / _MB,
-                        "total_upload":   t["upload"] / _MB,
+                        "total_download": round(t["download"] / _MB, 1),
+                        "total_upload":   round(t["upload"] / _MB, 1),
+                        "rx_packets": c.get("rx_packets", 0),
+                        "tx_packets": c.get("tx_packets", 0),
                     }
                 return out
 
         now = _read_now()
         t = time.time()
-        dt = max(t - (_state["last_ts"] or t), 1e-3)
+        t_ns = time.monotonic_ns()
+        if _last_sample_ns is None:
+            # prev came from the baseline file; the gap since is unknown, so
+            # only the totals take this delta
+            to_mbps = 0.0
+        else:
+            dt = max((t_ns - _last_sample_ns) / 1e9, 1e-3)
+            to_mbps = 8.0 / (dt * 1e6)   # bytes over dt → Mbps
+        prev_map = _state["prev"]
+        totals = _state["totals"]
 
         out = {}
         for i in IFACES:
-            prev = _state["prev"].get(i)
+            prev = prev_map.get(i)
             cur  = now.get(i, prev)
+            tot  = totals[i]
             if not cur:
                 # iface missing → zeros
                 out[i] = {"download": 0.0, "upload": 0.0,
-                          "total_download": _state["totals"].get(i, {"download":0})["download"] / _MB,
-                          "total_upload":   _state["totals"].get(i, {"upload":0})["upload"] / _MB}
+                          "total_download": round(tot["download"] / _MB, 1),
+                          "total_upload":   round(tot["upload"] / _MB, 1)}
                 continue
 
             if not prev:
@@ -104,23 +260,68 @@ def get_kernel_throughput():
             dr = max(0, cur["rx"] - prev["rx"])
             du = max(0, cur["tx"] - prev["tx"])
 
-            # Mbps = bits/sec / 1e6
-            out[i] = {"download": (dr * 8.0) / dt / 1e6,
-                      "upload":   (du * 8.0) / dt / 1e6}
-
             # accumulate totals (bytes)
-            tot = _state["totals"].setdefault(i, {"download": 0, "upload": 0})
             tot["download"] += dr
             tot["upload"]   += du
 
-            out[i]["total_download"] = tot["download"] / _MB
-            out[i]["total_upload"]   = tot["upload"] / _MB
+            out[i] = {"download": round(dr * to_mbps, 2),
+                      "upload":   round(du * to_mbps, 2),
+                      "total_download": round(tot["download"] / _MB, 1),
+                      "total_upload":   round(tot["upload"] / _MB, 1),
+                      "rx_packets": cur.get("rx_packets", 0),
+                      "tx_packets": cur.get("tx_packets", 0)}
 
         _state["prev"] = now
         _state["last_ts"] = t
+        _last_sample_ns = t_ns
         _save_baseline()
         return out
 
+def ttl_cache(seconds):
+    """Memoize a function's result per argument tuple for `seconds`.
+
+    The computation runs under a per-function lock, so concurrent callers that
+    miss together share a single computation instead of repeating it.
+    wrapper.cache_info() reports hits/misses for tuning the TTL.
+    """
+    def decorator(fn):
+        lock = threading.Lock()
+        entries = {}   # args -> (expires_at, value)
+        counts = {'hits': 0, 'misses': 0}
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            with lock:
+                hit = entries.get(args)
+                if hit is not None and time.monotonic() < hit[0]:
+                    counts['hits'] += 1
+                    return hit[1]
+                counts['misses'] += 1
+                value = fn(*args)
+                entries[args] = (time.monotonic() + seconds, value)
+                return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        def cache_info():
+            with lock:
+                return dict(counts, ttl=seconds, size=len(entries))
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        return wrapper
+    return decorator
+
+def json_response(payload, status=200):
+    """jsonify() replacement that encodes with orjson when it is installed"""
+    if isinstance(payload, bytes):   # already-encoded JSON
+        return app.response_class(payload, status=status, mimetype="application/json")
+    if orjson is None:
+        return jsonify(payload), status
+    return app.response_class(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype="application/json")
+
 @app.after_request
 def after_request(response):
     # Prevent caching of API responses
@@ -130,56 +331,114 @@ def after_request(response):
         response.headers["Expires"] = "0"
     return response
 
-# Throughput monitoring with persistent storage
-last_stats = {}
-last_stats_time = 0
-
-# Setup logging with rotation
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, "main.log")),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+def format_local_time(ts=None):
+    """'YYYY-mm-dd HH:MM:SS' local time for an epoch timestamp (default: now)"""
+    return _format_local_second(int(time.time() if ts is None else ts))
+
+@functools.lru_cache(maxsize=32)
+def _format_local_second(sec):
+    # Whole seconds only, so "now" and the few log mtimes hit the cache
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+
+# Opt-in sampled profiling: WIFI_DASHBOARD_PROFILE=N writes a cProfile dump for
+# one request in every N to logs/profile (read with `python3 -m pstats`)
+try:
+    PROFILE_EVERY = int(os.environ.get("WIFI_DASHBOARD_PROFILE", "0") or 0)
+except ValueError:
+    # A typo in a debug knob must not stop the dashboard (the log handlers are
+    # not set up yet, so this goes to stderr / the journal)
+    logging.getLogger(__name__).warning(
+        "Ignoring WIFI_DASHBOARD_PROFILE=%r: expected an integer", os.environ["WIFI_DASHBOARD_PROFILE"])
+    PROFILE_EVERY = 0
+if PROFILE_EVERY > 0:
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+
+    _profile_dir = os.path.join(LOG_DIR, "profile")
+    os.makedirs(_profile_dir, exist_ok=True)
+    _plain_wsgi = app.wsgi_app
+    _profiled_wsgi = ProfilerMiddleware(_plain_wsgi, stream=None, profile_dir=_profile_dir)
+    _request_counter = itertools.count()
+
+    def _sampled_wsgi(environ, start_response):
+        if next(_request_counter) % PROFILE_EVERY == 0:
+            return _profiled_wsgi(environ, start_response)
+        return _plain_wsgi(environ, start_response)
+
+    app.wsgi_app = _sampled_wsgi
+
+# Setup logging with rotation. Request threads only enqueue records; a listener
+# thread does the formatting, the file/stream writes and the size-based rotation
+# of main.log (main.log.1 .. main.log.5).
+MAIN_LOG_MAX_BYTES = 10 * 1024 * 1024
+MAIN_LOG_BACKUPS = 5
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.handlers.RotatingFileHandler(os.path.join(LOG_DIR, "main.log"),
+                                         maxBytes=MAIN_LOG_MAX_BYTES,
+                                         backupCount=MAIN_LOG_BACKUPS),
+    logging.StreamHandler()
+]
+for _h in _log_handlers:
+    _h.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)   # flush queued records on exit
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues the record unformatted.
+
+    The stock prepare() merges msg % args (and renders any traceback) on the
+    calling thread; the queue here never leaves the process, so that work is
+    left to the listener's handlers instead.
+    """
+    def prepare(self, record):
+        return copy.copy(record)
 
-def log_action(msg):
-    """Log action to main log file with rotation"""
-    logger.info(msg)
-    # Check if main log needs rotation
-    rotate_log_if_needed(os.path.join(LOG_DIR, "main.log"))
+_queue_handler = _DeferredQueueHandler(_log_queue)
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+logger = logging.getLogger(__name__)
 
-def rotate_log_if_needed(log_path, max_size_mb=10, keep_backups=5):
-    """Rotate log file if it exceeds max_size_mb"""
+def log_action(msg, *args):
+    """Log action to main log file (rotation is handled by the file handler)"""
+    logger.info(msg, *args)
+
+# path -> ((st_mtime_ns, st_size), parsed value, checked_at); entries are
+# refreshed when the file changes, and the file is stat()ed at most once per
+# FILE_RECHECK_INTERVAL seconds
+FILE_RECHECK_INTERVAL = 2.0
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+def _cached_by_mtime(path, loader):
+    """Return loader() result, re-running it only when path's mtime/size changes"""
+    now = time.monotonic()
+    with _file_cache_lock:
+        hit = _file_cache.get(path)
+        if hit is not None and now - hit[2] < FILE_RECHECK_INTERVAL:
+            return hit[1]
     try:
-        if not os.path.exists(log_path):
-            return
-        
-        # Check file size
-        size_mb = os.path.getsize(log_path) / (1024 * 1024)
-        if size_mb > max_size_mb:
-            # Rotate existing backups
-            for i in range(keep_backups - 1, 0, -1):
-                old_backup = f"{log_path}.{i}"
-                new_backup = f"{log_path}.{i + 1}"
-                if os.path.exists(old_backup):
-                    if i == keep_backups - 1:
-                        os.remove(old_backup)  # Remove oldest
-                    else:
-                        os.rename(old_backup, new_backup)
-            
-            # Move current log to .1
-            if os.path.exists(log_path):
-                os.rename(log_path, f"{log_path}.1")
-            
-            logger.info(f"Rotated log file: {log_path} (was {size_mb:.1f}MB)")
-    except Exception as e:
-        logger.error(f"Error rotating log {log_path}: {e}")
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    if hit is not None and hit[0] == key:
+        value = hit[1]
+    else:
+        value = loader()
+    with _file_cache_lock:
+        _file_cache[path] = (key, value, now)
+    return value
+
+def _invalidate_file_cache(path):
+    with _file_cache_lock:
+        _file_cache.pop(path, None)
 
 def read_config():
-    """Read SSID configuration"""
+    """Read SSID configuration (cached until ssid.conf changes)"""
+    return _cached_by_mtime(CONFIG_FILE, _read_config_file)
+
+def _read_config_file():
     ssid, password = "", ""
     try:
         if os.path.exists(CONFIG_FILE):
@@ -191,94 +450,359 @@ def read_config():
         return ssid, password
     except Exception as e:
         # Log the error and return safe defaults; don't return Response objects here
-        logger.error(f"Error reading config: {e}")
+        logger.error("Error reading config: %s", e)
         return "", ""
 
 def write_config(ssid, password):
     """Write SSID configuration"""
     try:
         os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
+        # Write a private temp file and rename it over the old one, so readers
+        # (and the client scripts) never see a half-written config
+        tmp = CONFIG_FILE + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
             f.write(f"{ssid}\n{password}\n")
-        os.chmod(CONFIG_FILE, 0o600)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, CONFIG_FILE)
+        _invalidate_file_cache(CONFIG_FILE)
         return True
     except Exception as e:
-        logger.error(f"Error writing config: {e}")
+        logger.error("Error writing config: %s", e)
         return False
 
+def tail_lines(path, n, block=64 * 1024):
+    """Return the last n lines of path, reading backwards from EOF in blocks"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunks = []
+        newlines = 0
+        # n+1 newlines guarantees the first of the last n lines is complete
+        while pos > 0 and newlines <= n:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+    buf = b''.join(reversed(chunks))
+    return [ln.decode('utf-8', 'replace') for ln in buf.splitlines(keepends=True)[-n:]]
+
+@functools.lru_cache(maxsize=64)
+def _cached_tail(path, mtime_ns, size, n):
+    # mtime_ns/size only take part in the cache key
+    return tuple(tail_lines(path, n))
+
+_line_counts = {}   # path -> (inode, size, mtime_ns, newlines, last byte)
+_line_counts_lock = threading.Lock()
+
+def cached_line_count(path, st):
+    """Line count (a trailing partial line counts) for a file with stat st.
+
+    An unchanged file is not read at all and an appended-to log only has its
+    new bytes scanned; rotation (new inode) or truncation rescans from 0.
+    """
+    with _line_counts_lock:
+        hit = _line_counts.get(path)
+    key = (st.st_ino, st.st_size, st.st_mtime_ns)
+    if hit and hit[:3] == key:
+        newlines, last = hit[3], hit[4]
+    else:
+        if hit and hit[0] == st.st_ino and st.st_size > hit[1]:
+            added, tail = _count_newlines(path, hit[1], st.st_size)
+            newlines, last = hit[3] + added, tail or hit[4]
+        else:
+            newlines, last = _count_newlines(path, 0, st.st_size)
+        with _line_counts_lock:
+            _line_counts[path] = key + (newlines, last)
+    return newlines + (1 if last and last != b'\n' else 0)
+
 def read_log_file(log_file, lines=100, offset=0):
     """Read lines from log file with support for pagination and larger amounts"""
     log_path = os.path.join(LOG_DIR, log_file)
     try:
-        if os.path.exists(log_path):
-            with open(log_path, 'r') as f:
-                all_lines = f.readlines()
-                
-            # If offset is provided, start from that line
-            if offset > 0:
-                all_lines = all_lines[offset:]
-            
-            # Return the requested number of lines, or all if less available
-            if lines == -1:  # -1 means return all lines
-                return all_lines
-            else:
-                return all_lines[-lines:] if not offset else all_lines[:lines]
+        # Plain "last N lines" only needs the end of the file, and an unchanged
+        # file (same mtime and size) gives the same answer as last time
+        if lines > 0 and not offset:
+            st = os.stat(log_path)
+            return list(_cached_tail(log_path, st.st_mtime_ns, st.st_size, lines))
+
+        if offset > 0 and lines > 0:
+            # A page from the top: skip whole blocks by newline count, then
+            # decode only the lines of the page itself
+            with open(log_path, 'rb') as f:
+                if not _seek_line(f, offset):
+                    return []
+                return [ln.decode('utf-8', 'replace') for ln in itertools.islice(f, lines)]
+
+        with open(log_path, 'r') as f:
+            all_lines = f.readlines()
+
+        # If offset is provided, start from that line
+        if offset > 0:
+            all_lines = all_lines[offset:]
+
+        # Return the requested number of lines, or all if less available
+        if lines == -1:  # -1 means return all lines
+            return all_lines
+        else:
+            return all_lines[-lines:] if not offset else all_lines[:lines]
+    except FileNotFoundError:
         return []
     except Exception as e:
-        logger.error(f"Error reading log file {log_file}: {e}")
+        logger.error("Error reading log file %s: %s", log_file, e)
         return [f"Error reading log: {e}"]
 
+def _count_newlines(path, start, end, block=1 << 20):
+    """(newline count, last byte) for bytes [start, end) of path, scanned in 1 MiB blocks"""
+    newlines = 0
+    last = b''
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0 and (chunk := f.read(min(block, remaining))):
+            newlines += chunk.count(b'\n')
+            last = chunk[-1:]
+            remaining -= len(chunk)
+    return newlines, last
+
+def _seek_line(f, n, block=1 << 20):
+    """Position binary file f at the start of line n (0-based); False if it has fewer lines"""
+    pos = f.tell()
+    while True:
+        chunk = f.read(block)
+        if not chunk:
+            return False
+        found = chunk.count(b'\n')
+        if found < n:
+            n -= found
+            pos += len(chunk)
+            continue
+        i = -1
+        for _ in range(n):
+            i = chunk.index(b'\n', i + 1)
+        f.seek(pos + i + 1)
+        # a newline at EOF ends the last line; no line n starts after it
+        return bool(f.peek(1))
+
 def get_log_file_info(log_file):
     """Get information about a log file (size, line count, etc.)"""
     log_path = os.path.join(LOG_DIR, log_file)
     try:
-        if os.path.exists(log_path):
-            size = os.path.getsize(log_path)
-            with open(log_path, 'r') as f:
-                line_count = sum(1 for _ in f)
-            
-            return {
-                'exists': True,
-                'size_bytes': size,
-                'size_mb': round(size / (1024 * 1024), 2),
-                'line_count': line_count,
-                'last_modified': datetime.fromtimestamp(os.path.getmtime(log_path)).strftime('%Y-%m-%d %H:%M:%S')
-            }
+        # One stat gives both size and mtime
+        st = os.stat(log_path)
+        return {
+            'exists': True,
+            'size_bytes': st.st_size,
+            'size_mb': round(st.st_size / (1024 * 1024), 2),
+            'line_count': cached_line_count(log_path, st),
+            'last_modified': format_local_time(st.st_mtime)
+        }
+    except FileNotFoundError:
         return {'exists': False}
     except Exception as e:
-        logger.error(f"Error getting log file info {log_file}: {e}")
+        logger.error("Error getting log file info %s: %s", log_file, e)
         return {'exists': False, 'error': str(e)}
 
-def get_network_stats():
-    """Get network interface statistics from /proc/net/dev"""
-    stats = {}
+# Dashboard log tails kept in memory: an inotify watch on LOG_DIR tells us when
+# one of the logs grows or is rotated, and only the new bytes are read.
+STATUS_LOG_NAMES = ('main', 'wired', 'wifi-good', 'wifi-bad')
+STATUS_LOG_LINES = 50
+
+class _TailedLog:
+    def __init__(self, name):
+        self.path = os.path.join(LOG_DIR, f"{name}.log")
+        self.lines = deque(maxlen=STATUS_LOG_LINES)
+        self.info = {'exists': False}
+        self.inode = None
+        self.offset = 0
+        self.newlines = 0
+        self.last_byte = b''
+
+    def reload(self):
+        """Re-read the tail and line count from scratch (start-up, rotation, truncation)"""
+        self.lines.clear()
+        self.inode, self.offset, self.newlines, self.last_byte = None, 0, 0, b''
+        try:
+            st = os.stat(self.path)
+            self.lines.extend(tail_lines(self.path, STATUS_LOG_LINES))
+            self.newlines, self.last_byte = _count_newlines(self.path, 0, st.st_size)
+        except FileNotFoundError:
+            self.info = {'exists': False}
+            return
+        self.inode, self.offset = st.st_ino, st.st_size
+        self._set_info(st)
+
+    def refresh(self):
+        """Append whatever was written since the last look"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self.lines.clear()
+            self.inode, self.info = None, {'exists': False}
+            return
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            self.reload()
+            return
+        if st.st_size == self.offset:
+            self._set_info(st)
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+        self.offset += len(data)
+        self.newlines += data.count(b'\n')
+        self.last_byte = data[-1:]
+        text = data.decode('utf-8', errors='replace')
+        if self.lines and not self.lines[-1].endswith('\n'):
+            text = self.lines.pop() + text   # finish the partial last line
+        self.lines.extend(text.splitlines(keepends=True))
+        self._set_info(st)
+
+    def _set_info(self, st):
+        self.info = {
+            'exists': True,
+            'size_bytes': st.st_size,
+            'size_mb': round(st.st_size / (1024 * 1024), 2),
+            'line_count': self.newlines + (1 if self.last_byte and self.last_byte != b'\n' else 0),
+            'last_modified': format_local_time(st.st_mtime)
+        }
+
+_tailed_logs = {}
+_tailed_logs_lock = threading.Lock()
+_log_watcher_thread = None
+
+def _watch_logs(inotify):
+    by_file = {f"{name}.log": log for name, log in _tailed_logs.items()}
+    while True:
+        events = inotify.read()
+        if any(e.mask & inotify_flags.Q_OVERFLOW for e in events):
+            changed = set(by_file.values())
+        else:
+            changed = {by_file[e.name] for e in events if e.name in by_file}
+        with _tailed_logs_lock:
+            for log in changed:
+                try:
+                    log.refresh()
+                except Exception as e:
+                    logger.error("Error following %s: %s", log.path, e)
+
+def _start_log_watcher():
+    """Start the inotify log follower once; False if inotify is unavailable"""
+    global _log_watcher_thread
+    if _log_watcher_thread is not None:
+        return _log_watcher_thread.is_alive()
+    with _tailed_logs_lock:
+        if _log_watcher_thread is not None:
+            return _log_watcher_thread.is_alive()
+        if INotify is None:
+            _log_watcher_thread = threading.Thread()  # never started: marks "unavailable"
+            return False
+        try:
+            inotify = INotify()
+            inotify.add_watch(LOG_DIR, inotify_flags.MODIFY | inotify_flags.CREATE |
+                              inotify_flags.DELETE | inotify_flags.MOVED_FROM |
+                              inotify_flags.MOVED_TO | inotify_flags.CLOSE_WRITE)
+        except OSError as e:
+            logger.error("inotify unavailable, tailing logs per request: %s", e)
+            _log_watcher_thread = threading.Thread()
+            return False
+        for name in STATUS_LOG_NAMES:
+            log = _TailedLog(name)
+            log.reload()
+            _tailed_logs[name] = log
+        _log_watcher_thread = threading.Thread(target=_watch_logs, args=(inotify,),
+                                               name="log-watcher", daemon=True)
+        _log_watcher_thread.start()
+        return True
+
+def status_log_tails():
+    """({name: last 50 lines}, {name: file info}) for the dashboard logs"""
+    if _start_log_watcher():
+        with _tailed_logs_lock:
+            return ({name: list(log.lines) for name, log in _tailed_logs.items()},
+                    {name: dict(log.info) for name, log in _tailed_logs.items()})
+    # No inotify: read them on demand, overlapping the reads on the I/O pool
+    log_fs = {name: _io_pool.submit(read_log_file, f'{name}.log', STATUS_LOG_LINES)
+              for name in STATUS_LOG_NAMES}
+    info_fs = {name: _io_pool.submit(get_log_file_info, f'{name}.log')
+               for name in STATUS_LOG_NAMES}
+    return ({name: f.result() for name, f in log_fs.items()},
+            {name: f.result() for name, f in info_fs.items()})
+
+async def _run_async(cmd, timeout):
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
     try:
-        with open('/proc/net/dev', 'r') as f:
-            lines = f.readlines()
-            
-        for line in lines[2:]:  # Skip header lines
-            if ':' in line:
-                parts = line.split(':')
-                iface = parts[0].strip()
-                
-                # Skip loopback and other virtual interfaces
-                if iface in ['lo'] or 'docker' in iface or 'veth' in iface:
-                    continue
-                
-                # Parse stats
-                fields = parts[1].split()
-                if len(fields) >= 9:
-                    stats[iface] = {
-                        'rx_bytes': int(fields[0]),
-                        'tx_bytes': int(fields[8]),
-                        'rx_packets': int(fields[1]),
-                        'tx_packets': int(fields[9]),
-                        'timestamp': time.time()
-                    }
-    except Exception as e:
-        logger.error(f"Error reading network stats: {e}")
-    
-    return stats
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, proc.returncode,
+                                       out.decode(errors='replace'), err.decode(errors='replace'))
+
+def run_concurrently(cmds, timeout=5):
+    """Run independent commands at once; returns a CompletedProcess or exception per command"""
+    async def _gather():
+        return await asyncio.gather(*(_run_async(c, timeout) for c in cmds), return_exceptions=True)
+    return asyncio.run(_gather())
+
+def _prefixlen(netmask):
+    """Prefix length for a dotted IPv4 or colon IPv6 netmask"""
+    return bin(int(ipaddress.ip_address(netmask))).count('1')
+
+def get_interface_addresses():
+    """{iface: [{'family', 'address', 'cidr'}, ...]} via getifaddrs(), no subprocess"""
+    out = {}
+    for iface, addrs in psutil.net_if_addrs().items():
+        for a in addrs:
+            if a.family not in (socket.AF_INET, socket.AF_INET6):
+                continue
+            address = a.address.split('%', 1)[0]   # drop IPv6 scope suffix (fe80::1%eth0)
+            cidr = f"{address}/{_prefixlen(a.netmask)}" if a.netmask else address
+            out.setdefault(iface, []).append({'family': a.family, 'address': address, 'cidr': cidr})
+    return out
+
+def first_ipv4(addrs):
+    """First IPv4 address (CIDR notation) from a get_interface_addresses() entry, or None"""
+    for a in addrs or ():
+        if a['family'] == socket.AF_INET:
+            return a['cidr']
+    return None
+
+# IP/MAC per interface only change on a lease or reconfigure; keep them for a few
+# seconds and drop the entry when the UI touches that interface.
+IFACE_CACHE_TTL = 10.0
+_IFACE_CACHE = {}   # iface -> (ip, mac, expiry)
+_iface_cache_lock = threading.Lock()
+
+def get_iface_ip_mac(iface):
+    """(ipv4 cidr or None, mac or None) for iface, cached for IFACE_CACHE_TTL seconds"""
+    now = time.monotonic()
+    with _iface_cache_lock:
+        hit = _IFACE_CACHE.get(iface)
+    if hit and hit[2] > now:
+        return hit[0], hit[1]
+
+    ip, mac = None, None
+    for a in psutil.net_if_addrs().get(iface, ()):
+        if a.family == socket.AF_INET and ip is None and not a.address.startswith('127.'):
+            ip = f"{a.address}/{_prefixlen(a.netmask)}" if a.netmask else a.address
+        elif a.family == psutil.AF_LINK and mac is None:
+            mac = a.address
+    with _iface_cache_lock:
+        _IFACE_CACHE[iface] = (ip, mac, now + IFACE_CACHE_TTL)
+    return ip, mac
+
+def invalidate_iface_cache(iface=None):
+    """Forget cached IP/MAC for one interface, or all of them"""
+    with _iface_cache_lock:
+        if iface is None:
+            _IFACE_CACHE.clear()
+        else:
+            _IFACE_CACHE.pop(iface, None)
 
 def read_persistent_stats(interface):
     """FIXED: Read persistent stats with better error handling"""
@@ -305,12 +829,16 @@ def read_persistent_stats(interface):
                 'upload': 0, 
                 'timestamp': time.time()
             }
-            with open(stats_file, 'w') as f:
-                json.dump(initial_stats, f)
+            # One write to a temp file, then rename: the traffic scripts that
+            # also read this file never see it half-written
+            tmp = stats_file + ".tmp"
+            with open(tmp, 'w') as f:
+                f.write(json.dumps(initial_stats))
+            os.replace(tmp, stats_file)
             return initial_stats
             
     except (json.JSONDecodeError, ValueError, IOError) as e:
-        logger.error(f"Error reading persistent stats for {interface}: {e}")
+        logger.error("Error reading persistent stats for %s: %s", interface, e)
         # Return safe defaults
         return {
             'download': 0, 
@@ -318,139 +846,134 @@ def read_persistent_stats(interface):
             'timestamp': time.time()
         }
 
-def calculate_throughput():
-    """
-    FIXED: Calculate throughput with better error handling and interface filtering
-    """
-    global last_stats, last_stats_time
+PRIMARY_IP_TTL = 30.0
+_primary_ip_cache = (0.0, None)   # (expires_at, ip)
 
-    now = time.time()
-    current_stats = get_network_stats()
-    throughput = {}
+def _get_primary_ip():
+    """Primary IPv4 without forking `hostname -I`; cached for PRIMARY_IP_TTL seconds"""
+    global _primary_ip_cache
+    expires, ip = _primary_ip_cache
+    if ip and time.monotonic() < expires:
+        return ip
 
-    # Build service map from assignments with error handling
+    ip = None
     try:
-        a = get_interface_assignments()
-        good_iface = a.get('good_interface', 'wlan0')
-        bad_iface = a.get('bad_interface', 'wlan1')
-        wired_iface = a.get('wired_interface', 'eth0')
-
-        service_map = {
-            wired_iface: 'wired-test',
-            good_iface: 'wifi-good',
-        }
-        if bad_iface and bad_iface != 'none':
-            service_map[bad_iface] = 'wifi-bad'
-    except Exception as e:
-        logger.error(f"Error reading interface assignments: {e}")
-        good_iface, bad_iface, wired_iface = 'wlan0', 'wlan1', 'eth0'
-        service_map = {
-            'eth0': 'wired-test',
-            'wlan0': 'wifi-good',
-            'wlan1': 'wifi-bad'
-        }
-
-    # FIXED: Only include physical interfaces, filter out virtual ones
-    candidates = set()
-    for iface in current_stats.keys():
-        # Skip virtual interfaces
-        if any(skip in iface for skip in ['lo', 'docker', 'veth', 'br-']):
-            continue
-        candidates.add(iface)
-    
-    # Always include our expected interfaces even if not in current stats
-    candidates.update({wired_iface, good_iface})
-    if bad_iface and bad_iface != 'none':
-        candidates.add(bad_iface)
-
-    # Compute deltas
-    have_prev = bool(last_stats) and last_stats_time > 0
-    dt = max(0.001, now - (last_stats_time or now))  # Avoid division by zero
-
-    for iface in candidates:
-        cur = current_stats.get(iface)
-        prev = last_stats.get(iface) if have_prev else None
-
-        # Calculate rates
-        if cur and prev:
-            rx_rate = max(0, (cur['rx_bytes'] - prev['rx_bytes']) / dt)
-            tx_rate = max(0, (cur['tx_bytes'] - prev['tx_bytes']) / dt)
-            rx_pkts = max(0, (cur['rx_packets'] - prev['rx_packets']))
-            tx_pkts = max(0, (cur['tx_packets'] - prev['tx_packets']))
-        else:
-            rx_rate = tx_rate = 0.0
-            rx_pkts = tx_pkts = 0
-
-        # FIXED: Better service active detection
-        active = False
+        # Connecting a UDP socket only selects a route; no packet is sent
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('10.255.255.255', 1))
+            ip = s.getsockname()[0]
+    except OSError:
+        pass
+    if not ip or ip.startswith('127.') or ip == '0.0.0.0':
+        ip = None
+        for addrs in psutil.net_if_addrs().values():
+            for a in addrs:
+                if a.family == socket.AF_INET and not a.address.startswith('127.'):
+                    ip = a.address
+                    break
+            if ip:
+                break
+
+    _primary_ip_cache = (time.monotonic() + PRIMARY_IP_TTL, ip)
+    return ip
+
+NM_ACTIVE_CMD = [NMCLI, 'connection', 'show', '--active']
+NM_WIFI_CMD = [NMCLI, '-t', '-f', 'ACTIVE,SSID,SIGNAL,FREQ', 'dev', 'wifi']
+
+_nm = None   # NetworkManager proxy once connected; False if the bus is unusable
+
+def _nm_manager():
+    """NetworkManager proxy on the system bus (created once), or None without D-Bus"""
+    global _nm
+    if _nm is None and SystemBus is not None:
         try:
-            svc = service_map.get(iface, '')
-            if svc:
-                r = subprocess.run(['systemctl', 'is-active', f'{svc}.service'],
-                                   capture_output=True, text=True, timeout=2)
-                active = (r.stdout.strip() == 'active')
-            else:
-                # For interfaces without services, check if they have an IP
-                active = bool(cur and cur.get('rx_bytes', 0) > 0)
-        except Exception:
-            active = False
-
-        # Get persistent totals with error handling
-        try:
-            totals = read_persistent_stats(iface)
+            _nm = SystemBus().get('org.freedesktop.NetworkManager')
         except Exception as e:
-            logger.error(f"Error reading persistent stats for {iface}: {e}")
-            totals = {'download': 0, 'upload': 0, 'timestamp': now}
-
-        throughput[iface] = {
-            'download': rx_rate,  # bytes/s
-            'upload': tx_rate,    # bytes/s  
-            'active': active,
-            'rx_packets': rx_pkts,
-            'tx_packets': tx_pkts,
-            'total_download': totals.get('download', 0),
-            'total_upload': totals.get('upload', 0),
-            'stats_timestamp': totals.get('timestamp', now),
-        }
-
-    # Update for next calculation
-    last_stats = current_stats
-    last_stats_time = now
-    
-    return throughput
-
-def get_system_info():
-    """Get system information"""
+            logger.error("Cannot connect to NetworkManager over D-Bus, using nmcli: %s", e)
+            _nm = False
+    return _nm or None
+
+@functools.lru_cache(maxsize=64)
+def _nm_object(path):
+    # NM never reuses object paths, so a proxy (and its introspection) stays valid
+    return SystemBus().get('org.freedesktop.NetworkManager', path)
+
+_NM_TYPE_NAMES = {'802-11-wireless': 'wifi', '802-3-ethernet': 'ethernet'}
+
+def _nm_active_text(nm):
+    """`nmcli connection show --active` table from NM's ActiveConnections"""
+    rows = [('NAME', 'UUID', 'TYPE', 'DEVICE')]
+    for path in nm.ActiveConnections:
+        ac = _nm_object(path)
+        devices = ','.join(_nm_object(d).Interface for d in ac.Devices) or '--'
+        rows.append((ac.Id, ac.Uuid, _NM_TYPE_NAMES.get(ac.Type, ac.Type), devices))
+    widths = [max(len(r[i]) for r in rows) for i in range(3)]
+    return ''.join('  '.join(c.ljust(w) for c, w in zip(r, widths)) + '  ' + r[3] + '\n'
+                   for r in rows)
+
+def _nm_wifi_text(nm):
+    """The ACTIVE=yes lines of NM_WIFI_CMD, from each Wi-Fi device's active access point"""
+    out = []
+    for path in nm.Devices:
+        dev = _nm_object(path)
+        if dev.DeviceType != 2:   # NM_DEVICE_TYPE_WIFI
+            continue
+        ap_path = dev.ActiveAccessPoint
+        if ap_path == '/':
+            continue
+        ap = _nm_object(ap_path)
+        # escaped the way `nmcli -t` escapes it
+        ssid = bytes(ap.Ssid).decode('utf-8', 'replace').replace('\\', '\\\\').replace(':', '\\:')
+        out.append(f"yes:{ssid}:{ap.Strength}:{ap.Frequency} MHz\n")
+    return ''.join(out)
+
+_NM_DBUS_QUERIES = {tuple(NM_ACTIVE_CMD): _nm_active_text, tuple(NM_WIFI_CMD): _nm_wifi_text}
+
+def run_probes(cmds, timeout=5):
+    """run_concurrently(), but nmcli queries are answered over D-Bus when NetworkManager is reachable"""
+    results = [None] * len(cmds)
+    nm = _nm_manager()
+    if nm is not None:
+        for i, cmd in enumerate(cmds):
+            query = _NM_DBUS_QUERIES.get(tuple(cmd))
+            if query is None:
+                continue
+            try:
+                results[i] = subprocess.CompletedProcess(cmd, 0, query(nm), '')
+            except Exception as e:
+                logger.error("NetworkManager D-Bus query failed, falling back to nmcli: %s", e)
+    pending = [i for i, r in enumerate(results) if r is None]
+    if pending:
+        for i, r in zip(pending, run_concurrently([cmds[i] for i in pending], timeout)):
+            results[i] = r
+    return results
+
+def netem_cmd():
+    return [TC, 'qdisc', 'show', 'dev', get_interface_assignments().get('good_interface', 'wlan0')]
+
+def get_system_info(netem_result=None, nm_result=None):
+    """Get system information (tc/nmcli results may be passed in already run)"""
     try:
         # Get IP address
-        ip_result = subprocess.run(['hostname', '-I'], capture_output=True, text=True, timeout=5)
-        ip_address = ip_result.stdout.strip().split()[0] if ip_result.stdout.strip() else "Unknown"
-        
+        ip_address = _get_primary_ip() or "Unknown"
+
+        # tc / nmcli are independent, so run them concurrently
+        if netem_result is None or nm_result is None:
+            netem_result, nm_result = run_probes([netem_cmd(), NM_ACTIVE_CMD])
+
         # Get interface information
-        interfaces = {}
-        ip_result = subprocess.run(['ip', '-o', 'addr'], capture_output=True, text=True, timeout=5)
-        for line in ip_result.stdout.splitlines():
-            parts = line.split()
-            if len(parts) >= 4:
-                iface = parts[1]
-                addr = parts[3]
-                if iface not in interfaces:
-                    interfaces[iface] = []
-                interfaces[iface].append(addr)
-        
+        interfaces = {iface: [a['cidr'] for a in addrs]
+                      for iface, addrs in get_interface_addresses().items()}
+
         # Get netem status
-        try:
-            assignments = get_interface_assignments()
-            good_iface = assignments.get('good_interface', 'wlan0')
-            netem_result = subprocess.run(['tc', 'qdisc', 'show', 'dev', good_iface], 
-                                        capture_output=True, text=True, timeout=5)
-            netem_status = netem_result.stdout.strip() if netem_result.returncode == 0 else "No netem configured"
-        except Exception:
+        if isinstance(netem_result, Exception):
             netem_status = "Error checking netem status"
-        
+        else:
+            netem_status = netem_result.stdout.strip() if netem_result.returncode == 0 else "No netem configured"
+
         # Get NetworkManager connection status
-        nm_result = subprocess.run(['nmcli', 'connection', 'show', '--active'], 
-                                 capture_output=True, text=True, timeout=5)
+        if isinstance(nm_result, Exception):
+            raise nm_result
         active_connections = nm_result.stdout.strip() if nm_result.returncode == 0 else "Error getting connections"
         
         return {
@@ -458,37 +981,133 @@ def get_system_info():
             'interfaces': interfaces,
             'netem_status': netem_status,
             'active_connections': active_connections,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'timestamp': format_local_time()
         }
     except Exception as e:
-        logger.error(f"Error getting system info: {e}")
+        logger.error("Error getting system info: %s", e)
         return {
             'ip_address': "Error",
             'interfaces': {},
             'netem_status': f"Error: {e}",
             'active_connections': f"Error: {e}",
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'timestamp': format_local_time()
         }
 
+_systemd = None   # Manager proxy once connected; False if the bus is unusable
+
+def _systemd_manager():
+    """systemd Manager proxy on the system bus (created once), or None without D-Bus"""
+    global _systemd
+    if _systemd is None and SystemBus is not None:
+        try:
+            _systemd = SystemBus().get('.systemd1')
+        except Exception as e:
+            logger.error("Cannot connect to systemd over D-Bus, using systemctl: %s", e)
+            _systemd = False
+    return _systemd or None
+
+def unit_active_states(units):
+    """ActiveState of each unit, in order.
+
+    Uses one call on the long-lived D-Bus connection when pydbus is available,
+    otherwise one batched `systemctl is-active` (which prints one state per
+    line in order).
+    """
+    try:
+        mgr = _systemd_manager()
+        if mgr is not None:
+            try:
+                rows = mgr.ListUnitsByNames(list(units))   # systemd >= 230: just these units
+            except Exception:
+                rows = mgr.ListUnits()
+            loaded = {u[0]: u[3] for u in rows}
+            # units systemd has not loaded are reported as inactive, like systemctl does
+            return [loaded.get(u, 'inactive') for u in units]
+    except Exception as e:
+        logger.error("D-Bus unit query failed, falling back to systemctl: %s", e)
+
+    # Non-zero exit just means at least one unit is not active, so ignore it
+    result = subprocess.run([SYSTEMCTL, 'is-active', *units],
+                            capture_output=True, text=True, timeout=5)
+    states = [s.strip() for s in result.stdout.splitlines()]
+    return states + ['unknown'] * (len(units) - len(states))
+
+_UNIT_JOB_METHODS = {'start': 'StartUnit', 'stop': 'StopUnit', 'restart': 'RestartUnit'}
+# The only units and job types the UI may touch (the polkit rule matches these)
+UNIT_ACTIONS = frozenset(_UNIT_JOB_METHODS)
+MANAGED_SERVICES = frozenset(('wired-test', 'wifi-good', 'wifi-bad'))
+
+# Repeated clicks on the same unit within this window are dropped rather than
+# each queueing another systemd job
+UNIT_ACTION_COOLDOWN = 1.0
+_unit_last_action = {}   # unit -> monotonic time of the last accepted action
+_unit_last_action_lock = threading.Lock()
+
+def claim_unit_action(unit):
+    """True if an action on unit may go ahead now (and starts its cooldown)"""
+    now = time.monotonic()
+    with _unit_last_action_lock:
+        if now - _unit_last_action.get(unit, float('-inf')) < UNIT_ACTION_COOLDOWN:
+            return False
+        _unit_last_action[unit] = now
+        return True
+
+def queue_unit_action(action, units):
+    """Queue start/stop/restart jobs without waiting for them (like --no-block).
+
+    Goes straight to systemd over the held D-Bus connection; the polkit rule
+    installed by 07-services.sh lets the dashboard user manage its own units.
+    Falls back to one `sudo systemctl --no-block` call, for the units D-Bus
+    did not queue, if D-Bus is unavailable or refuses. Returns (ok, error_text).
+    """
+    pending = list(units)
+    mgr = _systemd_manager()
+    if mgr is not None:
+        try:
+            method = getattr(mgr, _UNIT_JOB_METHODS[action])
+            while pending:
+                method(pending[0], 'replace')
+                pending.pop(0)   # queued; a restart must not be repeated below
+            return True, ''
+        except Exception as e:
+            logger.info("D-Bus %s not permitted, using sudo systemctl: %s", action, e)
+
+    result = subprocess.run([SUDO, SYSTEMCTL, action, '--no-block', *pending],
+                            capture_output=True, text=True, timeout=10)
+    return result.returncode == 0, result.stderr
+
 def get_service_status():
     """Get status of all INTEGRATED services"""
     # INTEGRATED SERVICES ONLY - no separate traffic services
     services = ['wifi-dashboard', 'wired-test', 'wifi-good', 'wifi-bad']
-    status = {}
-    
-    for service in services:
-        try:
-            result = subprocess.run(['systemctl', 'is-active', f'{service}.service'], 
-                                  capture_output=True, text=True, timeout=5)
-            status[service] = result.stdout.strip()
-        except Exception as e:
-            status[service] = f"Error: {e}"
-    
+
+    try:
+        states = unit_active_states([f'{s}.service' for s in services])
+        status = dict(zip(services, states))
+    except Exception as e:
+        status = {service: f"Error: {e}" for service in services}
+
     return status
 
+ASSIGNMENTS_FILE = os.path.join(BASE_DIR, "configs", "interface-assignments.conf")
+
 def get_interface_assignments():
     """Read and return interface assignment information (supports lower/upper-case keys)"""
-    assignments_file = os.path.join(BASE_DIR, "configs", "interface-assignments.conf")
+    # Callers may annotate the dict, so hand out a copy of the cached parse
+    return dict(_cached_by_mtime(ASSIGNMENTS_FILE, _read_interface_assignments))
+
+# KEY=value / KEY="value" lines (comments and blanks never match; CRLF endings are fine)
+_ASSIGNMENT_LINE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["\']?(.*?)["\']?[ \t\r]*$', re.M)
+_ASSIGNMENT_KEYS = {
+    'wifi_good_interface': 'good_interface', 'good_interface': 'good_interface',
+    'wifi_good_interface_type': 'good_type', 'good_type': 'good_type',
+    'wifi_bad_interface': 'bad_interface', 'bad_interface': 'bad_interface',
+    'wifi_bad_interface_type': 'bad_type', 'bad_type': 'bad_type',
+    'wired_interface': 'wired_interface',
+}
+
+def _read_interface_assignments():
+    assignments_file = ASSIGNMENTS_FILE
     assignments = {
         'good_interface': 'wlan0',
         'good_type': 'unknown',
@@ -501,127 +1120,195 @@ def get_interface_assignments():
     try:
         if os.path.exists(assignments_file):
             with open(assignments_file, 'r') as f:
-                for raw in f:
-                    line = raw.strip()
-                    if not line or line.startswith('#') or '=' not in line:
-                        continue
-                    key, value = [s.strip() for s in line.split('=', 1)]
-                    value = value.strip('"\'')
-                    k = key.lower()
-
-                    if k in ('wifi_good_interface', 'good_interface'):
-                        assignments['good_interface'] = value
-                    elif k in ('wifi_good_interface_type', 'good_type'):
-                        assignments['good_type'] = value
-                    elif k in ('wifi_bad_interface', 'bad_interface'):
-                        assignments['bad_interface'] = None if value in ('none', 'disabled', '') else value
-                    elif k in ('wifi_bad_interface_type', 'bad_type'):
-                        assignments['bad_type'] = value
-                    elif k in ('wired_interface',):
-                        assignments['wired_interface'] = value
+                text = f.read()
+            # One regex sweep over the file instead of strip/split per line
+            for key, value in _ASSIGNMENT_LINE.findall(text):
+                field = _ASSIGNMENT_KEYS.get(key.lower())
+                if field == 'bad_interface' and value in ('none', 'disabled', ''):
+                    value = None
+                if field:
+                    assignments[field] = value
 
             assignments['auto_detected'] = True
     except Exception as e:
-        logger.error(f"Error reading interface assignments: {e}")
+        logger.error("Error reading interface assignments: %s", e)
 
     return assignments
 
-def get_interface_capabilities():
-    """Get detailed interface capabilities and status"""
+@functools.lru_cache(maxsize=1)
+def _board_is_dual_band():
+    """Whether the Pi model has dual-band built-in Wi-Fi (the board never changes)"""
+    with open('/proc/cpuinfo', 'r') as f:
+        cpuinfo = f.read()
+    return any(model in cpuinfo for model in ['Raspberry Pi 4', 'Raspberry Pi 3 Model B Plus', 'Raspberry Pi Zero 2'])
+
+def _link_states():
+    """[(iface, operstate)] from sysfs: the same UP/DOWN `ip link show` prints, no fork"""
+    links = []
+    for iface in sorted(os.listdir('/sys/class/net')):
+        try:
+            with open(f'/sys/class/net/{iface}/operstate') as f:
+                links.append((iface, f.read().strip().upper()))
+        except OSError:
+            continue
+    return links
+
+def get_interface_capabilities(wifi_result=None):
+    """Get detailed interface capabilities and status (NM_WIFI_CMD result may be passed in)"""
     interfaces = {}
     
     try:
-        # Get all network interfaces
-        result = subprocess.run(['ip', 'link', 'show'], capture_output=True, text=True, timeout=5)
-        
-        for line in result.stdout.splitlines():
-            if ':' in line and ('wlan' in line or 'eth' in line):
-                parts = line.split(':')
-                if len(parts) >= 2:
-                    iface = parts[1].strip()
-                    
-                    # Get basic info
-                    state = 'DOWN'
-                    if 'state UP' in line:
-                        state = 'UP'
-                    elif 'state DOWN' in line:
-                        state = 'DOWN'
-                    
-                    # Get IP address
-                    ip_result = subprocess.run(['ip', 'addr', 'show', iface], 
-                                             capture_output=True, text=True, timeout=5)
-                    ip_addr = None
-                    for ip_line in ip_result.stdout.splitlines():
-                        if 'inet ' in ip_line and '127.0.0.1' not in ip_line:
-                            ip_addr = ip_line.strip().split()[1]
-                            break
-                    
-                    # Determine interface type
-                    iface_type = 'unknown'
-                    capabilities = []
-                    
-                    if iface.startswith('eth'):
-                        iface_type = 'ethernet'
-                        capabilities = ['wired', 'high_bandwidth']
-                    elif iface.startswith('wlan'):
-                        iface_type = 'wifi'
-                        
-                        # Try to determine if built-in or USB
-                        try:
-                            device_path = os.readlink(f'/sys/class/net/{iface}/device')
-                            if 'mmc' in device_path or 'sdio' in device_path:
-                                capabilities.append('builtin')
-                                # Check if it's a dual-band Pi
-                                with open('/proc/cpuinfo', 'r') as f:
-                                    cpuinfo = f.read()
-                                    if any(model in cpuinfo for model in ['Raspberry Pi 4', 'Raspberry Pi 3 Model B Plus', 'Raspberry Pi Zero 2']):
-                                        capabilities.append('dual_band')
-                                    else:
-                                        capabilities.append('2.4ghz_only')
-                            elif 'usb' in device_path:
-                                capabilities.append('usb')
-                                capabilities.append('2.4ghz_only')  # Assume 2.4GHz unless detected otherwise
-                        except:
-                            capabilities.append('unknown_type')
-                    
-                    # Get wireless info if available
-                    wireless_info = {}
-                    if iface.startswith('wlan'):
-                        try:
-                            # Try to get current connection info
-                            nm_result = subprocess.run(['nmcli', '-t', '-f', 'ACTIVE,SSID,SIGNAL,FREQ', 'dev', 'wifi'], 
-                                                     capture_output=True, text=True, timeout=5)
-                            for nm_line in nm_result.stdout.splitlines():
-                                if nm_line.startswith('yes:'):
-                                    parts = nm_line.split(':')
-                                    if len(parts) >= 4:
-                                        wireless_info = {
-                                            'ssid': parts[1] if parts[1] else None,
-                                            'signal': parts[2] if parts[2] else None,
-                                            'frequency': parts[3] if parts[3] else None
-                                        }
-                        except:
-                            pass
-                    
-                    interfaces[iface] = {
-                        'name': iface,
-                        'type': iface_type,
-                        'state': state,
-                        'ip_address': ip_addr,
-                        'capabilities': capabilities,
-                        'wireless_info': wireless_info
-                    }
-                    
+        # The Wi-Fi scan output is the same for every wlan, so parse it once
+        active_wifi = {}
+        try:
+            nm_result = wifi_result if wifi_result is not None else run_probes([NM_WIFI_CMD])[0]
+            if isinstance(nm_result, Exception):
+                raise nm_result
+            for nm_line in nm_result.stdout.splitlines():
+                if nm_line.startswith('yes:'):
+                    parts = nm_line.split(':')
+                    if len(parts) >= 4:
+                        active_wifi = {
+                            'ssid': parts[1] if parts[1] else None,
+                            'signal': parts[2] if parts[2] else None,
+                            'frequency': parts[3] if parts[3] else None
+                        }
+        except Exception:
+            pass
+
+        for iface, link_state in _link_states():
+            if 'wlan' not in iface and 'eth' not in iface:
+                continue
+
+            # Get basic info
+            state = 'UP' if link_state == 'UP' else 'DOWN'
+
+            # Get IP/MAC address (cached, no per-interface `ip addr show`)
+            ip_addr, mac_addr = get_iface_ip_mac(iface)
+
+            # Determine interface type
+            iface_type = 'unknown'
+            capabilities = []
+
+            if iface.startswith('eth'):
+                iface_type = 'ethernet'
+                capabilities = ['wired', 'high_bandwidth']
+            elif iface.startswith('wlan'):
+                iface_type = 'wifi'
+
+                # Try to determine if built-in or USB
+                try:
+                    device_path = os.readlink(f'/sys/class/net/{iface}/device')
+                    if 'mmc' in device_path or 'sdio' in device_path:
+                        capabilities.append('builtin')
+                        # Check if it's a dual-band Pi
+                        if _board_is_dual_band():
+                            capabilities.append('dual_band')
+                        else:
+                            capabilities.append('2.4ghz_only')
+                    elif 'usb' in device_path:
+                        capabilities.append('usb')
+                        capabilities.append('2.4ghz_only')  # Assume 2.4GHz unless detected otherwise
+                except:
+                    capabilities.append('unknown_type')
+
+            # Get wireless info if available
+            wireless_info = {}
+            if iface.startswith('wlan'):
+                wireless_info = dict(active_wifi)
+
+            interfaces[iface] = {
+                'name': iface,
+                'type': iface_type,
+                'state': state,
+                'ip_address': ip_addr,
+                'mac_address': mac_addr,
+                'capabilities': capabilities,
+                'wireless_info': wireless_info
+            }
+
     except Exception as e:
-        logger.error(f"Error getting interface capabilities: {e}")
+        logger.error("Error getting interface capabilities: %s", e)
     
     return interfaces
 
+# Background sampler: service state, ip/tc/nmcli output and interface capabilities
+# change far less often than the UI polls, so a daemon thread refreshes them and
+# /status copies the latest snapshot instead of forking per request.
+SAMPLER_INTERVAL = 2.0
+_snapshot = None
+_snapshot_lock = threading.Lock()
+_sampler_wakeup = threading.Event()
+_sampler_thread = None
+
+def _take_snapshot():
+    global _snapshot
+    # Every command the snapshot needs goes out at once on one event loop,
+    # rather than a thread per probe; the nmcli queries and service states are
+    # D-Bus calls when the bus is available
+    netem_result, nm_result, wifi_result = run_probes([netem_cmd(), NM_ACTIVE_CMD, NM_WIFI_CMD])
+    snap = {
+        'system_info': get_system_info(netem_result, nm_result),
+        'service_status': get_service_status(),
+        'interface_capabilities': get_interface_capabilities(wifi_result),
+    }
+    with _snapshot_lock:
+        _snapshot = snap
+    return snap
+
+def _sampler():
+    # the first snapshot is taken by the request that started us
+    while True:
+        _sampler_wakeup.wait(SAMPLER_INTERVAL)
+        _sampler_wakeup.clear()
+        try:
+            _take_snapshot()
+        except Exception as e:
+            logger.error("Status sampler error: %s", e)
+
+def get_status_snapshot():
+    """Latest sampled system/service/capability info (starts the sampler on first use)"""
+    global _sampler_thread
+    with _snapshot_lock:
+        snap = _snapshot
+        if _sampler_thread is None or not _sampler_thread.is_alive():
+            _sampler_thread = threading.Thread(target=_sampler, name="status-sampler", daemon=True)
+            _sampler_thread.start()
+    if snap is None:
+        snap = _take_snapshot()
+    return snap
+
+def preload_templates():
+    """Compile page templates up front so the first request doesn't pay for it"""
+    for name in ("dashboard.html", "traffic_control.html"):
+        try:
+            app.jinja_env.get_template(name)
+        except Exception as e:
+            logger.error("Error preloading template %s: %s", name, e)
+
+def _index_etag():
+    """Weak validator for the dashboard page: ssid.conf + template mtimes"""
+    parts = []
+    for path in (CONFIG_FILE, os.path.join(app.root_path, app.template_folder, "dashboard.html")):
+        try:
+            parts.append(str(os.stat(path).st_mtime_ns))
+        except OSError:
+            parts.append("0")
+    return "-".join(parts)
+
 @app.route("/")
 def index():
     """Main dashboard page"""
+    etag = _index_etag()
+    # Pending flash messages are rendered into the page, so always render then
+    if not session.get("_flashes") and request.if_none_match.contains_weak(etag):
+        return "", 304
+
     ssid, _ = read_config()
-    return render_template("dashboard.html", ssid=ssid)
+    resp = make_response(render_template("dashboard.html", ssid=ssid))
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
 
 def build_log_labels(assignments: dict) -> dict:
     good_iface = assignments.get("good_interface") or "wlan0"
@@ -633,45 +1320,101 @@ def build_log_labels(assignments: dict) -> dict:
         "wifi-bad":    f"Wi-Fi Bad Client - Auth Failures ({bad_iface})",
     }
 
+STATUS_CACHE_TTL = 1.0   # seconds; collapses concurrent dashboard polls
+
+def _status_static_fields(ssid, password, interface_assignments):
+    return {
+        "ssid": ssid,
+        "password_masked": "*" * len(password) if password else "",
+        "interface_assignments": interface_assignments,
+        "log_labels": build_log_labels(interface_assignments),
+    }
+
+@functools.lru_cache(maxsize=4)
+def _status_static_json(ssid, password, assignment_items):
+    # Only changes with ssid.conf / interface-assignments.conf, so it is encoded once
+    return orjson.dumps(_status_static_fields(ssid, password, dict(assignment_items)),
+                        option=orjson.OPT_NON_STR_KEYS)
+
+def _status_volatile_fields():
+    snapshot = get_status_snapshot()
+
+    # Recent logs from INTEGRATED services only - NO separate traffic services
+    logs, log_info = status_log_tails()
+
+    return {
+        "system_info": snapshot['system_info'],
+        "service_status": snapshot['service_status'],
+        "interface_capabilities": snapshot['interface_capabilities'],
+        "logs": logs,
+        "log_info": log_info,
+        "success": True
+    }
+
+@ttl_cache(STATUS_CACHE_TTL)
+def _status_parts():
+    """(/status body as encoded JSON bytes, its ETag), shared by every poll in the TTL window"""
+    ssid, password = read_config()
+    interface_assignments = get_interface_assignments()
+    volatile = _status_volatile_fields()
+
+    # The tag leaves out the sample time, which moves on every sampler tick even
+    # when nothing else has, so an idle dashboard's polls are answered with 304s
+    system_info = {k: v for k, v in volatile['system_info'].items() if k != 'timestamp'}
+    etag = hashlib.blake2b(_encode_json([ssid, password, interface_assignments,
+                                         dict(volatile, system_info=system_info)]),
+                           digest_size=8).hexdigest()
+
+    if orjson is None:
+        return _encode_json({**_status_static_fields(ssid, password, interface_assignments),
+                             **volatile}), etag
+
+    static = _status_static_json(ssid, password, tuple(sorted(interface_assignments.items())))
+    body = orjson.dumps(volatile, option=orjson.OPT_NON_STR_KEYS)
+    # Splice the two objects: {"a":1} + {"b":2} -> {"a":1,"b":2}
+    return static[:-1] + b',' + body[1:], etag
+
+def _status_payload():
+    """/status body as encoded JSON bytes"""
+    return _status_parts()[0]
+
+def invalidate_status_cache():
+    """Drop cached /status and /traffic_status payloads after a state-changing action"""
+    _status_parts.cache_clear()
+    _traffic_status_payload.cache_clear()
+    _sampler_wakeup.set()
+
 @app.route("/status")
 def status():
     """API endpoint for status information with interface assignments"""
     try:
-        ssid, password = read_config()
-        system_info = get_system_info()
-        service_status = get_service_status()
-        interface_assignments = get_interface_assignments()
-        interface_capabilities = get_interface_capabilities()
-        
-        # Get recent logs from INTEGRATED services only - NO separate traffic services
-        logs = {
-            'main':       read_log_file('main.log', 50),
-            'wired':      read_log_file('wired.log', 50),
-            'wifi-good':  read_log_file('wifi-good.log', 50),
-            'wifi-bad':   read_log_file('wifi-bad.log', 50),
-        }  
-        
-        # Get log file information for integrated services only
-        log_info = {}
-        for log_name in logs.keys():
-            log_info[log_name] = get_log_file_info(f'{log_name}.log')
-        
-        return jsonify({
-            "ssid": ssid,
-            "password_masked": "*" * len(password) if password else "",
-            "system_info": system_info,
-            "service_status": service_status,
-            "interface_assignments": interface_assignments,
-            "interface_capabilities": interface_capabilities,
-            "logs": logs,
-            "log_info": log_info,
-            "log_labels": build_log_labels(interface_assignments),
-            "success": True
-        })
+        body, etag = _status_parts()
+        # Unchanged status (apart from the sample time) is answered with an
+        # empty 304. Weak, because Flask-Compress rewrites strong ETags to
+        # "<tag>:gzip" and the browser would then never send back a tag that
+        # matches here.
+        if request.if_none_match.contains_weak(etag):
+            resp = make_response("", 304)
+        else:
+            resp = json_response(body)
+        resp.set_etag(etag, weak=True)
+        # Same window as the server-side cache; private because it names the SSID
+        resp.headers['Cache-Control'] = 'private, max-age=1'
+        return resp
+    except Exception as e:
+        logger.error("Error in status endpoint: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
+@app.route("/api/snapshot")
+def api_snapshot():
+    """/status and /api/throughput in one response, both spliced from their caches"""
+    try:
+        throughput_body = get_throughput_snapshot()[0]
+        return json_response(b'{"status":' + _status_payload() +
+                             b',"throughput":' + throughput_body + b'}')
     except Exception as e:
-        logger.error(f"Error in status endpoint: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("Error in snapshot endpoint: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
 @app.route("/api/logs/<log_name>")
 def api_logs(log_name):
@@ -696,16 +1439,24 @@ def api_logs(log_name):
         # Only expose integrated service logs
         valid_logs = ["main", "wired", "wifi-good", "wifi-bad"]
         if log_name not in valid_logs:
-            return jsonify({"success": False, "error": "Invalid log name"}), 400
+            return json_response({"success": False, "error": "Invalid log name"}, 400)
 
         lines    = int(request.args.get("lines", 200))
         offset   = int(request.args.get("offset", 0))
         all_lines = request.args.get("all", "false").lower() == "true"
 
-        log_content = read_log_file(f"{log_name}.log", -1 if all_lines else lines, offset)
+        if all_lines:
+            # Whole file as text/plain: sendfile() from the page cache instead of
+            # decoding every line into a list and JSON-encoding it
+            log_path = os.path.join(LOG_DIR, f"{log_name}.log")
+            if not os.path.exists(log_path):
+                return json_response({"success": False, "error": "Log file not found"}, 404)
+            return send_file(log_path, mimetype="text/plain", conditional=True, max_age=0)
+
+        log_content = read_log_file(f"{log_name}.log", lines, offset)
         log_info    = get_log_file_info(f"{log_name}.log")
 
-        return jsonify({
+        return json_response({
             "success": True,
             "log_name": log_name,
             "content": log_content,
@@ -714,50 +1465,134 @@ def api_logs(log_name):
             "offset": offset
         })
     except Exception as e:
-        logger.error(f"Error in logs API endpoint: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("Error in logs API endpoint: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 # --- /api/throughput (full block starts) ---
-@app.route("/api/throughput")
-def api_throughput():
+def _throughput_payload():
     """
-    Returns current per-interface throughput (Mbps) and cumulative totals (MB),
+    Current per-interface throughput (Mbps) and cumulative totals (MB),
     based on kernel counters. No dependence on shell-written JSON stats.
     """
+    # One timestamp per producer tick, shared by every client of this snapshot
+    ts = datetime.utcnow().isoformat()
     try:
         # Use your assignment helper to decide which interfaces to expose
         a = get_interface_assignments()
         candidates = set(["eth0", a.get("good_interface", "wlan0"), a.get("bad_interface", "wlan1")])
         candidates = {i for i in candidates if i}
 
-        # Kernel-based rates + totals
+        # Kernel-based rates, totals and packet counters from one /proc/net/dev read
         kdata = get_kernel_throughput()
 
-        # One psutil snapshot for packets/active flags
-        io = psutil.net_io_counters(pernic=True)
+        # One psutil snapshot for active flags
         stats = psutil.net_if_stats()
 
         out = {}
         for iface in candidates:
             d = kdata.get(iface, {"download": 0.0, "upload": 0.0, "total_download": 0.0, "total_upload": 0.0})
-            i = io.get(iface)
             s = stats.get(iface)
 
             out[iface] = {
                 "active": bool(s and s.isup),
-                "download": round(float(d["download"]), 2),            # Mbps
-                "upload":   round(float(d["upload"]),   2),            # Mbps
-                "rx_packets": int(getattr(i, "packets_recv", 0) or 0),
-                "tx_packets": int(getattr(i, "packets_sent", 0) or 0),
-                "total_download": round(float(d["total_download"]), 1),  # MB
-                "total_upload":   round(float(d["total_upload"]),   1),  # MB
+                "download": d["download"],              # Mbps, already rounded
+                "upload":   d["upload"],                # Mbps
+                "rx_packets": d.get("rx_packets", 0),
+                "tx_packets": d.get("tx_packets", 0),
+                "total_download": d["total_download"],  # MB
+                "total_upload":   d["total_upload"],    # MB
             }
 
-        return jsonify({"success": True, "throughput": out, "timestamp": datetime.utcnow().isoformat()})
+        return {"success": True, "throughput": out, "timestamp": ts}
     except Exception as e:
-        logger.exception("throughput endpoint failed")
-        return jsonify({"success": False, "error": str(e), "throughput": {}, "timestamp": datetime.utcnow().isoformat()}), 500
+        logger.exception("throughput sample failed")
+        return {"success": False, "error": str(e), "throughput": {}, "timestamp": ts}
+
+def _encode_json(payload):
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+THROUGHPUT_COLUMNS = ("download", "upload", "total_download", "total_upload",
+                      "rx_packets", "tx_packets", "active")
+
+def _throughput_columns(payload):
+    """Column layout for the SSE feed: {"names": [...], "<field>": [...]} instead of
+    one object per interface, so each key is sent once rather than per interface"""
+    names = sorted(payload["throughput"])
+    rows = [payload["throughput"][n] for n in names]
+    cols = {"success": payload["success"], "timestamp": payload["timestamp"], "names": names}
+    for field in THROUGHPUT_COLUMNS:
+        cols[field] = [r[field] for r in rows]
+    return cols
+
+# One producer samples the counters each tick and every client (polling or
+# streaming) gets the same pre-encoded snapshot.
+THROUGHPUT_INTERVAL = 1.0
+STREAM_MAX_SECONDS = 300      # SSE clients reconnect on their own; bounds a dead socket's thread
+# Each open stream holds one gunicorn thread (16 in 07-services.sh); past this
+# many, clients get a 503 and the page polls /api/snapshot instead
+MAX_STREAM_CLIENTS = 4
+_stream_slots = threading.BoundedSemaphore(MAX_STREAM_CLIENTS)
+_throughput_snapshot = None   # (encoded body, http status, encoded SSE columns)
+_throughput_cond = threading.Condition()
+_throughput_thread = None
+
+def _throughput_producer():
+    global _throughput_snapshot
+    while True:
+        payload = _throughput_payload()
+        snap = (_encode_json(payload), 200 if payload["success"] else 500,
+                _encode_json(_throughput_columns(payload)))
+        with _throughput_cond:
+            _throughput_snapshot = snap
+            _throughput_cond.notify_all()
+        time.sleep(THROUGHPUT_INTERVAL)
+
+def get_throughput_snapshot():
+    """Latest (body, status, columns) for /api/throughput; starts the producer on first use"""
+    global _throughput_thread
+    with _throughput_cond:
+        if _throughput_thread is None or not _throughput_thread.is_alive():
+            _throughput_thread = threading.Thread(target=_throughput_producer,
+                                                  name="throughput-producer", daemon=True)
+            _throughput_thread.start()
+        while _throughput_snapshot is None:
+            _throughput_cond.wait()
+        return _throughput_snapshot
+
+@app.route("/api/throughput")
+def api_throughput():
+    """Current per-interface throughput (Mbps) and cumulative totals (MB)"""
+    body, status, _ = get_throughput_snapshot()
+    return json_response(body, status)
+
+@app.route("/api/throughput/stream")
+def api_throughput_stream():
+    """Server-Sent Events: one column-layout throughput snapshot per producer tick"""
+    if not _stream_slots.acquire(blocking=False):
+        return json_response({"success": False, "error": "Too many throughput streams"}, 503)
+
+    def gen():
+        snap = get_throughput_snapshot()
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        yield b"retry: 2000\ndata: " + snap[2] + b"\n\n"
+        while time.monotonic() < deadline:
+            with _throughput_cond:
+                _throughput_cond.wait_for(lambda: _throughput_snapshot is not snap, timeout=15)
+                fresh = _throughput_snapshot
+            if fresh is snap:
+                yield b": keepalive\n\n"
+                continue
+            snap = fresh
+            yield b"data: " + snap[2] + b"\n\n"
+
+    resp = app.response_class(gen(), mimetype="text/event-stream",
+                              headers={"X-Accel-Buffering": "no"})
+    # Runs when the server closes the response, even if gen() never started
+    resp.call_on_close(_stream_slots.release)
+    return resp
 
 
 @app.route("/api/interfaces")
@@ -765,7 +1600,10 @@ def api_interfaces():
     """API endpoint for detailed interface information"""
     try:
         interface_assignments = get_interface_assignments()
-        interface_capabilities = get_interface_capabilities()
+        # Sampled in the background with the rest of /status; copy the entries
+        # because they get annotated below
+        interface_capabilities = {iface: dict(info) for iface, info in
+                                  get_status_snapshot()['interface_capabilities'].items()}
         
         # Combine assignment and capability data
         interface_data = {}
@@ -808,7 +1646,7 @@ def api_interfaces():
                     'description': 'Unassigned Interface'
                 })
         
-        return jsonify({
+        return json_response({
             "success": True,
             "auto_detected": interface_assignments['auto_detected'],
             "interfaces": interface_data,
@@ -816,94 +1654,104 @@ def api_interfaces():
         })
         
     except Exception as e:
-        logger.error(f"Error in interfaces endpoint: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("Error in interfaces endpoint: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
 @app.route("/traffic_control")
 def traffic_control():
     """Traffic control management page"""
     return render_template("traffic_control.html")
 
-@app.route("/traffic_status")
-def traffic_status():
-    """API endpoint for traffic generation status (integrated services)."""
+def _collect_service(item, status, addr_info):
+    """Build one /traffic_status entry; runs on the I/O pool."""
+    service_name, interface, description, log_file = item
     try:
-        a = get_interface_assignments()
-        # Build (service, iface, description, log_file)
-        items = [
-            ('wired-test', a.get('wired_interface', 'eth0'),
-             'Wired Client with Integrated Heavy Traffic', 'wired.log'),
-            ('wifi-good',  a.get('good_interface',  'wlan0'),
-             'Wi-Fi Good Client with Integrated Medium Traffic', 'wifi-good.log'),
-        ]
-        if a.get('bad_interface'):
-            items.append(
-                ('wifi-bad', a['bad_interface'],
-                 'Wi-Fi Bad Client (Auth Failures for Mist PCAP)', 'wifi-bad.log')
-            )
+        if isinstance(status, Exception):
+            raise status
 
-        traffic_status_data = {}
+        # IP info, e.g. "192.168.1.111/24"
+        ip_info = first_ipv4(addr_info.get(interface)) or "Not available"
 
-        for service_name, interface, description, log_file in items:
-            try:
-                # Service status
-                result = subprocess.run(
-                    ['systemctl', 'is-active', f'{service_name}.service'],
-                    capture_output=True, text=True, timeout=5
-                )
-                status = result.stdout.strip()
+        # Recent logs (last 20 lines); only an empty result needs a second look
+        recent = read_log_file(log_file, lines=20)
+        exists = bool(recent) or os.path.exists(os.path.join(LOG_DIR, log_file))
 
-                # IP info
-                ip_result = subprocess.run(
-                    ['ip', 'addr', 'show', interface],
-                    capture_output=True, text=True, timeout=5
-                )
-                ip_info = "Not available"
-                if ip_result.returncode == 0:
-                    # naive parse: first 'inet ' line
-                    for ln in ip_result.stdout.splitlines():
-                        ln = ln.strip()
-                        if ln.startswith('inet '):
-                            ip_info = ln.split()[1]  # e.g., "192.168.1.111/24"
-                            break
-
-                # Recent logs (last 20 lines) + file info
-                recent = read_log_file(log_file, lines=20)
-                info = get_log_file_info(log_file)
-                exists = bool(info.get('exists'))
-
-                # Get persistent traffic stats
-                persistent_stats = read_persistent_stats(interface)
-
-                traffic_status_data[interface] = {
-                    'service_name': service_name,
-                    'service_status': status,
-                    'description': description,
-                    'ip_address': ip_info,
-                    'recent_logs': recent,
-                    'log_file_exists': exists,
-                    'total_download_mb': round(persistent_stats['download'] / (1024 * 1024), 1),
-                    'total_upload_mb': round(persistent_stats['upload'] / (1024 * 1024), 1),
-                    'stats_timestamp': persistent_stats['timestamp']
-                }
+        # Get persistent traffic stats
+        persistent_stats = read_persistent_stats(interface)
 
-            except Exception as e:
-                traffic_status_data[interface] = {
-                    'service_name': service_name,
-                    'service_status': f'error: {e}',
-                    'description': description,
-                    'ip_address': 'unknown',
-                    'recent_logs': [],
-                    'log_file_exists': False,
-                    'total_download_mb': 0,
-                    'total_upload_mb': 0,
-                    'stats_timestamp': 0
-                }
+        return {
+            'service_name': service_name,
+            'service_status': status,
+            'description': description,
+            'ip_address': ip_info,
+            'recent_logs': recent,
+            'log_file_exists': exists,
+            'total_download_mb': round(persistent_stats['download'] / (1024 * 1024), 1),
+            'total_upload_mb': round(persistent_stats['upload'] / (1024 * 1024), 1),
+            'stats_timestamp': persistent_stats['timestamp']
+        }
+
+    except Exception as e:
+        return {
+            'service_name': service_name,
+            'service_status': f'error: {e}',
+            'description': description,
+            'ip_address': 'unknown',
+            'recent_logs': [],
+            'log_file_exists': False,
+            'total_download_mb': 0,
+            'total_upload_mb': 0,
+            'stats_timestamp': 0
+        }
+
+@ttl_cache(STATUS_CACHE_TTL)
+def _traffic_status_payload():
+    a = get_interface_assignments()
+    # Build (service, iface, description, log_file)
+    items = [
+        ('wired-test', a.get('wired_interface', 'eth0'),
+         'Wired Client with Integrated Heavy Traffic', 'wired.log'),
+        ('wifi-good',  a.get('good_interface',  'wlan0'),
+         'Wi-Fi Good Client with Integrated Medium Traffic', 'wifi-good.log'),
+    ]
+    if a.get('bad_interface'):
+        items.append(
+            ('wifi-bad', a['bad_interface'],
+             'Wi-Fi Bad Client (Auth Failures for Mist PCAP)', 'wifi-bad.log')
+        )
+
+    traffic_status_data = {}
+
+    # Interface addresses straight from the kernel instead of one `ip` call per service
+    try:
+        addr_info = get_interface_addresses()
+    except Exception as e:
+        logger.error("Error reading interface addresses: %s", e)
+        addr_info = {}
+
+    # One unit-state query for all services instead of one systemctl per service
+    try:
+        service_states = dict(zip((item[0] for item in items),
+                                  unit_active_states([f'{item[0]}.service' for item in items])))
+    except Exception as e:
+        service_states = {item[0]: e for item in items}
+
+    # Per-service log tails and stats files are independent; read them in parallel
+    futures = [(item, _io_pool.submit(_collect_service, item, service_states[item[0]], addr_info))
+               for item in items]
+    for (service_name, interface, description, log_file), fut in futures:
+        traffic_status_data[interface] = fut.result()
+
+    return {"interfaces": traffic_status_data, "success": True}
 
-        return jsonify({"interfaces": traffic_status_data, "success": True})
+@app.route("/traffic_status")
+def traffic_status():
+    """API endpoint for traffic generation status (integrated services)."""
+    try:
+        return json_response(_traffic_status_payload())
     except Exception as e:
-        logger.error(f"Error in traffic_status endpoint: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("Error in traffic_status endpoint: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
 @app.route("/traffic_action", methods=["POST"])
 def traffic_action():
@@ -913,9 +1761,9 @@ def traffic_action():
         action = request.form.get("action")
 
         if not interface or not action:
-            return jsonify({"success": False, "error": "Missing interface or action"}), 400
-        if action not in ['start', 'stop', 'restart']:
-            return jsonify({"success": False, "error": "Invalid action"}), 400
+            return json_response({"success": False, "error": "Missing interface or action"}, 400)
+        if action not in UNIT_ACTIONS:
+            return json_response({"success": False, "error": "Invalid action"}, 400)
 
         # Build valid iface set + iface->service map from assignments
         a = get_interface_assignments()
@@ -924,7 +1772,7 @@ def traffic_action():
             valid_ifaces.add(a['bad_interface'])
 
         if interface not in valid_ifaces:
-            return jsonify({"success": False, "error": "Invalid interface"}), 400
+            return json_response({"success": False, "error": "Invalid interface"}, 400)
 
         service_map = {
             a.get('wired_interface', 'eth0'): 'wired-test',
@@ -935,24 +1783,26 @@ def traffic_action():
 
         service_name = service_map.get(interface)
         if not service_name:
-            return jsonify({"success": False, "error": "No service mapped for interface"}), 400
+            return json_response({"success": False, "error": "No service mapped for interface"}, 400)
+
+        if not claim_unit_action(f'{service_name}.service'):
+            return json_response({"success": False, "error": f"{service_name} was just changed; try again shortly"}, 429)
 
         # Non-blocking control so UI stays responsive if service has ExecStartPre waits
-        result = subprocess.run(
-            ['sudo', 'systemctl', action, '--no-block', f'{service_name}.service'],
-            capture_output=True, text=True, timeout=10
-        )
+        ok, err = queue_unit_action(action, [f'{service_name}.service'])
 
-        if result.returncode == 0:
-            log_action(f"Service {service_name} {action} via UI (iface={interface})")
-            return jsonify({"success": True, "message": f"{service_name} {action} issued"})
+        if ok:
+            log_action("Service %s %s via UI (iface=%s)", service_name, action, interface)
+            invalidate_iface_cache(interface)
+            invalidate_status_cache()
+            return json_response({"success": True, "message": f"{service_name} {action} issued"})
         else:
-            logger.error(f"Failed to {action} {service_name}: {result.stderr}")
-            return jsonify({"success": False, "error": f"Failed to {action} {service_name}: {result.stderr}"}), 500
+            logger.error("Failed to %s %s: %s", action, service_name, err)
+            return json_response({"success": False, "error": f"Failed to {action} {service_name}: {err}"}, 500)
 
     except Exception as e:
-        logger.error(f"Error with traffic_action: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("Error with traffic_action: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
 @app.route("/update_wifi", methods=["POST"])
 def update_wifi():
@@ -966,30 +1816,39 @@ def update_wifi():
             return redirect("/")
 
         if write_config(new_ssid, new_password):
-            log_action(f"Wi-Fi config updated via UI: SSID={new_ssid}")
+            log_action("Wi-Fi config updated via UI: SSID=%s", new_ssid)
+            invalidate_iface_cache()
+            invalidate_status_cache()
             flash("Wi-Fi configuration updated successfully", "success")
 
             # Non-blocking restarts so the UI won't time out on ExecStartPre waits
             try:
-                subprocess.run(['sudo', 'systemctl', 'restart', '--no-block', 'wifi-good.service'])
-                subprocess.run(['sudo', 'systemctl', 'restart', '--no-block', 'wifi-bad.service'])
-                flash("Wi-Fi services restarting in the background…", "info")
+                # One request restarts both units
+                ok, err = queue_unit_action('restart', ['wifi-good.service', 'wifi-bad.service'])
+                if ok:
+                    flash("Wi-Fi services restarting in the background…", "info")
+                else:
+                    logger.error("Failed to restart Wi-Fi services: %s", err)
+                    flash(f"Configuration saved but failed to restart services: {err}", "warning")
 
-                # Run hostname verification script
+            except Exception as e:
+                logger.error("Error restarting services: %s", e)
+                flash("Configuration saved but failed to restart services", "warning")
+
+            # Run hostname verification script
+            try:
                 subprocess.Popen(
                     ["/home/pi/wifi_test_dashboard/scripts/verify-hostnames.sh"],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
-
             except Exception as e:
-                logger.error(f"Error restarting services: {e}")
-                flash("Configuration saved but failed to restart services", "warning")
+                logger.error("Error starting hostname verification: %s", e)
         else:
             flash("Failed to update configuration", "error")
 
     except Exception as e:
-        logger.error(f"Error updating Wi-Fi config: {e}")
+        logger.error("Error updating Wi-Fi config: %s", e)
         flash(f"Error updating configuration: {e}", "error")
 
     return redirect("/")
@@ -1004,11 +1863,9 @@ def set_netem():
         latency = request.form.get("latency", "0")
         loss = request.form.get("loss", "0")
 
-        # Remove existing netem safely
-        subprocess.run(["sudo", "tc", "qdisc", "del", "dev", good_iface, "root"],
-                       stderr=subprocess.DEVNULL, timeout=10)
-
-        cmd = ["sudo", "tc", "qdisc", "add", "dev", good_iface, "root", "netem"]
+        # "replace" swaps out any existing root qdisc (or adds one) in a single
+        # call, instead of a separate "del" followed by "add"
+        cmd = [SUDO, TC, "qdisc", "replace", "dev", good_iface, "root", "netem"]
         if int(latency) > 0:
             cmd.extend(["delay", f"{latency}ms"])
         if float(loss) > 0:
@@ -1016,13 +1873,15 @@ def set_netem():
 
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
-            log_action(f"Applied netem on {good_iface}: latency={latency}ms, loss={loss}%")
+            log_action("Applied netem on %s: latency=%sms, loss=%s%%", good_iface, latency, loss)
+            invalidate_iface_cache(good_iface)
+            invalidate_status_cache()
             flash(f"Network emulation applied on {good_iface}: {latency}ms latency, {loss}% loss", "success")
         else:
             flash(f"Failed to apply network emulation: {result.stderr}", "error")
 
     except Exception as e:
-        logger.error(f"Error setting netem: {e}")
+        logger.error("Error setting netem: %s", e)
         flash(f"Error configuring network emulation: {e}", "error")
 
     return redirect("/")
@@ -1034,51 +1893,82 @@ def service_action():
         service = request.form.get("service")
         action = request.form.get("action")
         
-        if service not in ['wired-test', 'wifi-good', 'wifi-bad']:
+        if service not in MANAGED_SERVICES:
             flash("Invalid service", "error")
             return redirect("/")
         
-        if action not in ['start', 'stop', 'restart']:
+        if action not in UNIT_ACTIONS:
             flash("Invalid action", "error")
             return redirect("/")
         
-        result = subprocess.run(['sudo', 'systemctl', action, f'{service}.service'], 
-                              capture_output=True, text=True, timeout=15)
-        
-        if result.returncode == 0:
-            log_action(f"Service {service} {action}ed via UI")
-            flash(f"Service {service} {action}ed successfully", "success")
+        if not claim_unit_action(f'{service}.service'):
+            flash(f"Service {service} was just changed; try again shortly", "error")
+            return redirect("/")
+
+        # Queue the job and return; the request thread doesn't wait out the
+        # unit's start/stop (the status sampler picks up the new state)
+        ok, err = queue_unit_action(action, [f'{service}.service'])
+
+        if ok:
+            log_action("Service %s %s issued via UI", service, action)
+            invalidate_status_cache()
+            flash(f"Service {service} {action} issued", "success")
         else:
-            flash(f"Failed to {action} service {service}: {result.stderr}", "error")
+            flash(f"Failed to {action} service {service}: {err}", "error")
             
     except Exception as e:
-        logger.error(f"Error with service action: {e}")
+        logger.error("Error with service action: %s", e)
         flash(f"Error performing service action: {e}", "error")
     
     return redirect("/")
 
+def spawn_detached(argv):
+    """Start argv (looked up on PATH) without Popen's pipe setup; a pool thread reaps it"""
+    # Python ignores SIGPIPE and the child would inherit that; restore the
+    # default as Popen does, and give the child its own session
+    pid = os.posix_spawnp(argv[0], argv, os.environ,
+                          setsigdef=(signal.SIGPIPE,), setsid=True)
+    _io_pool.submit(os.waitpid, pid, 0)
+    return pid
+
+POWER_ACTION_DELAY = 1.0   # seconds for the JSON reply to reach the browser first
+
+def spawn_after_reply(argv):
+    """spawn_detached(argv) once the current response has had time to go out"""
+    def _run():
+        try:
+            spawn_detached(argv)
+        except Exception as e:
+            logger.error("Error running %s: %s", " ".join(argv), e)
+    timer = threading.Timer(POWER_ACTION_DELAY, _run)
+    timer.daemon = True
+    timer.start()
+
 @app.route("/reboot", methods=["POST"])
 def reboot():
     """Reboot system"""
     try:
         log_action("System reboot requested via UI")
-        subprocess.Popen(["sudo", "reboot"])
-        return jsonify({"success": True, "message": "System rebooting..."}), 200
+        spawn_after_reply([SUDO, "reboot"])
+        return json_response({"success": True, "message": "System rebooting..."}, 200)
     except Exception as e:
-        logger.error(f"Error rebooting: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("Error rebooting: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
 @app.route("/shutdown", methods=["POST"])
 def shutdown():
     """Shutdown system"""
     try:
         log_action("System shutdown requested via UI")
-        subprocess.Popen(["sudo", "poweroff"])
-        return jsonify({"success": True, "message": "System shutting down..."}), 200
+        spawn_after_reply([SUDO, "poweroff"])
+        return json_response({"success": True, "message": "System shutting down..."}, 200)
     except Exception as e:
-        logger.error(f"Error shutting down: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("Error shutting down: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
+
+preload_templates()
 
 if __name__ == "__main__":
     log_action("Wi-Fi Test Dashboard v5.0 starting with persistent throughput tracking")
-    app.run(host="0.0.0.0", port=5000, debug=False)
\ No newline at end of file
+    # Fallback when gunicorn is not installed (see 07-services.sh); keep polls concurrent
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""WSGI entry point for production servers: `gunicorn wsgi:app` from the dashboard directory"""
+from app import app
+
+__all__ = ["app"]
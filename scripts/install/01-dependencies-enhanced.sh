@@ -41,6 +41,7 @@ apt-get install -y \
     python3 \
     python3-pip \
     python3-psutil \
+    python3-pydbus \
     curl \
     wget \
     jq \
@@ -150,9 +151,9 @@ apt-get install -y \
 
 # 8. Install Python dependencies
 log_info "Installing Python dependencies..."
-pip3 install flask requests --break-system-packages >/dev/null 2>&1 || {
+pip3 install flask requests orjson gunicorn inotify_simple Flask-Compress --break-system-packages >/dev/null 2>&1 || {
     log_warn "Failed to install Python packages with --break-system-packages, trying without..."
-    pip3 install flask requests >/dev/null 2>&1 || log_error "Failed to install Python packages"
+    pip3 install flask requests orjson gunicorn inotify_simple Flask-Compress >/dev/null 2>&1 || log_error "Failed to install Python packages"
 }
 
 # 9. Configure Wi-Fi country and hardware (Raspberry Pi specific)
@@ -299,7 +300,7 @@ for iface in wlan0 wlan1; do
 done
 
 # Check Python dependencies
-for pkg in flask requests; do
+for pkg in flask requests orjson gunicorn inotify_simple flask_compress; do
     if python3 -c "import $pkg" 2>/dev/null; then
         echo "✓ Python $pkg: Available"
     else
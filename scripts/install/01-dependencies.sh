@@ -114,9 +114,9 @@ fi
 
 # Install Python dependencies
 log_info "Installing Python dependencies..."
-pip3 install flask requests --break-system-packages >/dev/null 2>&1 || {
+pip3 install flask requests orjson gunicorn inotify_simple Flask-Compress --break-system-packages >/dev/null 2>&1 || {
     log_warn "Failed to install Python packages with --break-system-packages, trying without..."
-    pip3 install flask requests >/dev/null 2>&1 || log_error "Failed to install Python packages"
+    pip3 install flask requests orjson gunicorn inotify_simple Flask-Compress >/dev/null 2>&1 || log_error "Failed to install Python packages"
 }
 
 # Configure Wi-Fi country and unblock (Raspberry Pi specific)
@@ -392,8 +392,21 @@ if __name__ == "__main__":
 FLASK_APP_EOF
 fi
 
+# WSGI entry point used by gunicorn (see 07-services.sh)
+if curl -fsSL --max-time 30 --retry 3 "${REPO_URL}/app/wsgi.py" -o "$PI_HOME/wifi_test_dashboard/wsgi.py"; then
+    log_info "✓ Downloaded WSGI entry point"
+else
+    log_info "✗ Failed to download WSGI entry point, creating locally..."
+    cat > "$PI_HOME/wifi_test_dashboard/wsgi.py" <<'WSGI_EOF'
+"""WSGI entry point for production servers: `gunicorn wsgi:app` from the dashboard directory"""
+from app import app
+
+__all__ = ["app"]
+WSGI_EOF
+fi
+
 # Ensure proper ownership
-chown "$PI_USER:$PI_USER" "$PI_HOME/wifi_test_dashboard/app.py"
+chown "$PI_USER:$PI_USER" "$PI_HOME/wifi_test_dashboard/app.py" "$PI_HOME/wifi_test_dashboard/wsgi.py"
 
 # Verify the Flask app can be imported
 if sudo -u "$PI_USER" python3 -c "import sys; sys.path.insert(0, '$PI_HOME/wifi_test_dashboard'); import app" 2>/dev/null; then
@@ -44,6 +44,17 @@ log_info "Interface assignments: good=${GOOD_IFACE}, bad=${BAD_IFACE}, wired=${W
 
 # ---------- wifi-dashboard.service ----------
 log_info "Creating wifi-dashboard.service..."
+# Serve through gunicorn's threaded worker when available so slow subprocess
+# calls in one request don't block other polls. Keep a single process: the
+# throughput baselines, caches and status sampler are in-process state.
+# Each open throughput SSE stream holds a thread; app.py caps them at
+# MAX_STREAM_CLIENTS (4) so the other 12 threads stay free for polls/actions.
+if python3 -c "import gunicorn" 2>/dev/null && [[ -f "${DASHBOARD_DIR}/wsgi.py" ]]; then
+  DASHBOARD_EXEC="/usr/bin/python3 -m gunicorn --worker-class gthread --workers 1 --threads 16 --timeout 30 --bind 0.0.0.0:5000 --chdir ${DASHBOARD_DIR} wsgi:app"
+else
+  log_warn "gunicorn or wsgi.py not installed; wifi-dashboard will use the built-in Flask server"
+  DASHBOARD_EXEC="/usr/bin/python3 ${DASHBOARD_DIR}/app.py"
+fi
 cat > /etc/systemd/system/wifi-dashboard.service <<EOF
 [Unit]
 Description=Wi-Fi Test Dashboard Web Interface
@@ -57,7 +68,7 @@ Group=${PI_USER}
 WorkingDirectory=${DASHBOARD_DIR}
 Environment=PYTHONUNBUFFERED=1
 Environment=FLASK_ENV=production
-ExecStart=/usr/bin/python3 ${DASHBOARD_DIR}/app.py
+ExecStart=${DASHBOARD_EXEC}
 Restart=always
 RestartSec=10
 StandardOutput=journal
@@ -183,6 +194,27 @@ mkdir -p /var/run/wifi-dashboard
 chown root:root /var/run/wifi-dashboard
 chmod 1777 /var/run/wifi-dashboard
 
+# Let the dashboard start/stop/restart its own client units over D-Bus
+# (no sudo fork per UI action). Older polkit without JS rules ignores this
+# file and the dashboard falls back to sudo systemctl.
+if [[ -d /etc/polkit-1/rules.d ]]; then
+  log_info "Installing polkit rule for dashboard service control..."
+  cat > /etc/polkit-1/rules.d/50-wifi-dashboard.rules <<EOF
+polkit.addRule(function(action, subject) {
+    if (action.id == "org.freedesktop.systemd1.manage-units" &&
+        subject.user == "${PI_USER}") {
+        var unit = action.lookup("unit");
+        var verb = action.lookup("verb");
+        if ((unit == "wired-test.service" || unit == "wifi-good.service" || unit == "wifi-bad.service") &&
+            (verb == "start" || verb == "stop" || verb == "restart")) {
+            return polkit.Result.YES;
+        }
+    }
+});
+EOF
+  chmod 644 /etc/polkit-1/rules.d/50-wifi-dashboard.rules
+fi
+
 # Enable services in dependency order
 log_info "Enabling services with staggered startup..."
 systemctl daemon-reload
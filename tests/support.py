@@ -0,0 +1,26 @@
+"""Import app.py from a scratch deployment directory, as the installer lays it out"""
+import atexit
+import importlib
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+
+_app = None
+
+def load_app():
+    """The dashboard module, imported once per test run"""
+    global _app
+    if _app is None:
+        root = Path(tempfile.mkdtemp(prefix="wifi-dashboard-test-"))
+        atexit.register(shutil.rmtree, root, True)   # runs after the app's own atexit hooks
+        shutil.copy(REPO / "app" / "app.py", root)
+        shutil.copytree(REPO / "templates", root / "templates")
+        (root / "logs").mkdir()
+        (root / "configs").mkdir()
+        (root / "configs" / "ssid.conf").write_text("TestSSID\ntestpass\n")
+        sys.path.insert(0, str(root))
+        _app = importlib.import_module("app")
+    return _app
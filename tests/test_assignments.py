@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from support import load_app
+
+
+class InterfaceAssignmentsTest(unittest.TestCase):
+    def parse(self, text):
+        app = load_app()
+        fd, path = tempfile.mkstemp(suffix='.conf')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w', newline='') as f:
+            f.write(text)
+        with mock.patch.object(app, 'ASSIGNMENTS_FILE', path):
+            return app._read_interface_assignments()
+
+    def test_plain_and_quoted_values(self):
+        a = self.parse('# detected\ngood_interface=wlan1\nWIFI_BAD_INTERFACE="wlan0"\n'
+                       "wired_interface = 'eth1'\n")
+        self.assertEqual((a['good_interface'], a['bad_interface'], a['wired_interface']),
+                         ('wlan1', 'wlan0', 'eth1'))
+        self.assertTrue(a['auto_detected'])
+
+    def test_crlf_line_endings(self):
+        a = self.parse('good_interface=wlan1\r\nbad_interface="wlan0"\r\n'
+                       'good_type=usb  \r\nwired_interface=eth0\r\n')
+        self.assertEqual(a['good_interface'], 'wlan1')
+        self.assertEqual(a['bad_interface'], 'wlan0')
+        self.assertEqual(a['good_type'], 'usb')
+        self.assertEqual(a['wired_interface'], 'eth0')
+
+    def test_disabled_bad_interface(self):
+        for value in ('none', 'disabled', ''):
+            with self.subTest(value=value):
+                self.assertIsNone(self.parse(f'bad_interface={value}\r\n')['bad_interface'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from support import load_app
+
+
+class BaselineWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.app = load_app()
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.path = os.path.join(self.dir, 'io_baselines.json')
+        for name, value in (('STATS_DIR', self.dir), ('BASELINE_FILE', self.path),
+                            ('_state', {"prev": {}, "totals": {}, "last_ts": 0})):
+            patcher = mock.patch.object(self.app, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def saved(self):
+        with open(self.path) as f:
+            return json.load(f)
+
+    def test_newest_snapshot_is_written_last(self):
+        real_write = self.app._write_baseline
+        first_started = threading.Event()
+
+        def slow_write(payload):
+            first_started.set()
+            time.sleep(0.2)   # the first write is still running when newer snapshots arrive
+            real_write(payload)
+
+        with mock.patch.object(self.app, '_write_baseline', slow_write):
+            self.app._state["last_ts"] = 1
+            self.app._save_baseline(force=True)
+            first_started.wait(1)
+            for ts in range(2, 10):
+                self.app._state["last_ts"] = ts
+                self.app._save_baseline(force=True)
+            # once the pool has drained, the file holds the last snapshot
+            self.app._io_pool.submit(self.app._flush_baseline).result(timeout=5)
+        self.assertEqual(self.saved()["last_ts"], 9)
+
+    def test_exit_hook_writes_totals_since_last_save(self):
+        self.app._state["last_ts"] = 1
+        self.app._state["totals"] = {"wlan0": {"download": 5, "upload": 0}}
+        self.app._save_baseline(force=True)
+        self.app._io_pool.submit(self.app._flush_baseline).result(timeout=5)
+
+        # within the debounce window: no write until the process exits
+        self.app._state["totals"] = {"wlan0": {"download": 7, "upload": 0}}
+        self.app._save_baseline()
+        self.app._save_baseline_at_exit()
+        self.assertEqual(self.saved()["totals"]["wlan0"]["download"], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest import mock
+
+from support import load_app
+
+
+class StatusETagTest(unittest.TestCase):
+    def setUp(self):
+        self.app = load_app()
+        self.client = self.app.app.test_client()
+        self.snapshot = {
+            'system_info': {'ip_address': '192.168.1.10', 'timestamp': '2026-01-01 00:00:00'},
+            'service_status': {'wifi-good': 'active', 'wifi-bad': 'active'},
+            'interface_capabilities': {},
+        }
+        for name, value in (('get_status_snapshot', lambda: self.snapshot),
+                            ('status_log_tails', lambda: ({}, {}))):
+            patcher = mock.patch.object(self.app, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.app._status_parts.cache_clear()
+        self.addCleanup(self.app._status_parts.cache_clear)
+
+    def next_sample(self, **system_info):
+        # What a sampler tick does: a new snapshot, and the TTL cache has expired
+        self.snapshot = dict(self.snapshot, system_info=dict(self.snapshot['system_info'], **system_info))
+        self.app._status_parts.cache_clear()
+
+    def test_sampler_tick_alone_revalidates_with_304(self):
+        first = self.client.get('/status')
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers['ETag']
+
+        self.next_sample(timestamp='2026-01-01 00:00:02')
+        again = self.client.get('/status', headers={'If-None-Match': etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.get_data(), b'')
+
+    def test_changed_status_sends_new_body(self):
+        etag = self.client.get('/status').headers['ETag']
+
+        self.next_sample(timestamp='2026-01-01 00:00:02', ip_address='192.168.1.11')
+        again = self.client.get('/status', headers={'If-None-Match': etag})
+        self.assertEqual(again.status_code, 200)
+        self.assertNotEqual(again.headers['ETag'], etag)
+        self.assertEqual(again.get_json()['system_info']['ip_address'], '192.168.1.11')
+
+
+if __name__ == '__main__':
+    unittest.main()
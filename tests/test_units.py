@@ -0,0 +1,60 @@
+import subprocess
+import unittest
+from unittest import mock
+
+from support import load_app
+
+
+class FakeManager:
+    """systemd Manager stand-in that refuses jobs for some units"""
+
+    def __init__(self, refuse=()):
+        self.refuse = set(refuse)
+        self.queued = []
+
+    def RestartUnit(self, unit, mode):
+        if unit in self.refuse:
+            raise PermissionError(f"Interactive authentication required for {unit}")
+        self.queued.append(unit)
+
+
+class QueueUnitActionTest(unittest.TestCase):
+    def setUp(self):
+        self.app = load_app()
+        self.calls = []
+
+        def fake_run(argv, **kwargs):
+            self.calls.append(argv)
+            return subprocess.CompletedProcess(argv, 0, '', '')
+
+        patcher = mock.patch.object(self.app.subprocess, 'run', fake_run)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def queue(self, manager, units):
+        with mock.patch.object(self.app, '_systemd_manager', lambda: manager):
+            return self.app.queue_unit_action('restart', units)
+
+    def test_all_queued_over_dbus(self):
+        mgr = FakeManager()
+        self.assertEqual(self.queue(mgr, ['wifi-good.service', 'wifi-bad.service']), (True, ''))
+        self.assertEqual(mgr.queued, ['wifi-good.service', 'wifi-bad.service'])
+        self.assertEqual(self.calls, [])
+
+    def test_refused_unit_alone_falls_back_to_sudo(self):
+        mgr = FakeManager(refuse={'wifi-bad.service'})
+        ok, _ = self.queue(mgr, ['wifi-good.service', 'wifi-bad.service'])
+        self.assertTrue(ok)
+        self.assertEqual(mgr.queued, ['wifi-good.service'])
+        self.assertEqual(len(self.calls), 1)
+        # wifi-good was already restarted over D-Bus and must not be restarted again
+        self.assertEqual(self.calls[0][-3:], ['restart', '--no-block', 'wifi-bad.service'])
+
+    def test_no_dbus_uses_sudo_for_every_unit(self):
+        self.queue(None, ['wifi-good.service', 'wifi-bad.service'])
+        self.assertEqual(self.calls[0][-4:],
+                         ['restart', '--no-block', 'wifi-good.service', 'wifi-bad.service'])
+
+
+if __name__ == '__main__':
+    unittest.main()